@@ -1,3 +1,27 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from research.models import Politician
+from .models import PoliticianPicks
+
+
+class GetPicksQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('voter', password='secret')
+        picks = PoliticianPicks.objects.create(user=self.user)
+        picks.politicians.add(*(
+            Politician.objects.create(name=f"Politician {i}", bio="Long biography")
+            for i in range(5)
+        ))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_picks_query_count_does_not_grow_with_picks(self):
+        # The picks row and its politicians
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/auth/politicians/picks/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['politicians']), 5)
+        self.assertEqual(set(response.json()['politicians'][0]), {'id', 'name'})
@@ -6,6 +6,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from .models import PoliticianPicks
 from research.models import Politician
@@ -140,7 +141,11 @@ def get_picks(request, user_id=None):
         user = request.user
     
     try:
-        picks = PoliticianPicks.objects.get(user=user)
+        # Load the picked politicians in one query, with only the
+        # columns PoliticianPicksSerializer outputs
+        picks = PoliticianPicks.objects.prefetch_related(
+            Prefetch('politicians', queryset=Politician.objects.only('id', 'name'))
+        ).get(user=user)
         serializer = PoliticianPicksSerializer(picks)
         return Response(serializer.data)
     except PoliticianPicks.DoesNotExist:
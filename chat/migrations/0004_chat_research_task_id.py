@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-16 02:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0003_alter_chat_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chat',
+            name='research_task_id',
+            field=models.CharField(blank=True, default='', max_length=36),
+        ),
+    ]
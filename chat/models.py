@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
 from datetime import timedelta
@@ -14,6 +14,8 @@ class Chat(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     research_report = models.ForeignKey(ResearchResult, on_delete=models.CASCADE, null=True, blank=True)
+    # Research task still producing research_report; cleared once it finishes
+    research_task_id = models.CharField(max_length=36, blank=True, default='')
 
     class Meta:
         indexes = [
@@ -38,12 +40,15 @@ class Chat(models.Model):
         # Get all temporary chats older than the cutoff time
         old_chats = Chat.objects.filter(user=None, created_at__lt=cutoff_time)
 
-        # Log the number of chats to be deleted
-        count = old_chats.count()
-        print(f"Removing {count} temporary chats older than 24 hours")
+        # Delete the old chats and their Q&A with one DELETE each, instead
+        # of letting the collector load every chat before deleting.
+        # Neither model has delete signals, so nothing needs the instances
+        with transaction.atomic():
+            QandA.objects.filter(chat__in=old_chats)._raw_delete(old_chats.db)
+            count = old_chats._raw_delete(old_chats.db)
 
-        # Delete the old chats
-        old_chats.delete()
+        # Log the number of chats deleted
+        print(f"Removed {count} temporary chats older than 24 hours")
 
         return count
 
@@ -1,16 +1,16 @@
 from rest_framework import serializers
 from .models import Chat, QandA
-from research.serializers import ResearchResultSerializer
+from research.serializers import ResearchResultSerializer, CachedFieldsMixin
 
 class QandASerializer(serializers.ModelSerializer):
     class Meta:
         model = QandA
         fields = ['id', 'chat', 'question', 'answer', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = fields
 
-class ChatSerializer(serializers.ModelSerializer):
+class ChatSerializer(CachedFieldsMixin, serializers.ModelSerializer):
 
     class Meta:
         model = Chat
-        fields = ['id', 'politician', 'user', 'created_at', 'updated_at', 'research_report']
-        read_only_fields = ['id', 'created_at', 'updated_at', 'user']
+        fields = ['id', 'politician', 'user', 'created_at', 'updated_at', 'research_report', 'research_task_id']
+        read_only_fields = fields
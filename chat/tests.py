@@ -1,3 +1,77 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from research.models import Politician, ResearchResult
+from research.tasks import research_politician_task
+from .models import Chat
+from .views import _attach_finished_research
+
+
+class ChatListQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('voter', password='secret')
+        politician = Politician.objects.create(name="Jane Doe")
+        research = ResearchResult.objects.create(politician=politician, position="Senator")
+        for _ in range(5):
+            Chat.objects.create(politician="Jane Doe", user=self.user, research_report=research)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_chat_list_is_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/chat/chats/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 5)
+
+
+@mock.patch.object(research_politician_task, 'apply_async')
+class ChatResearchTaskTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('voter', password='secret')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_chat(self):
+        with mock.patch('chat.views.AsyncResult') as async_result:
+            async_result.return_value.ready.return_value = False
+            response = self.client.post('/api/chat/chats/', {'politician': 'Jane Doe', 'position': 'Senator'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.json()
+
+    def test_chat_is_created_with_queued_task(self, apply_async):
+        chat = self.create_chat()
+
+        self.assertIsNone(chat['research_report'])
+        self.assertEqual(chat['research_task_id'], apply_async.call_args.kwargs['task_id'])
+
+    def test_finished_task_attaches_report(self, apply_async):
+        chat = self.create_chat()
+        research = ResearchResult.objects.create(politician=Politician.objects.create(name="Jane Doe"), position="Senator")
+
+        with mock.patch('research.tasks.get_pipeline') as get_pipeline:
+            get_pipeline.return_value.research_politician.return_value = research
+            research_politician_task.apply(args=('jane doe', 'Senator'), task_id=chat['research_task_id'])
+
+        saved = Chat.objects.get(id=chat['id'])
+        self.assertEqual(saved.research_report_id, research.id)
+        self.assertEqual(saved.research_task_id, '')
+
+    def test_read_attaches_report_of_task_finished_before_save(self, apply_async):
+        chat = Chat.objects.get(id=self.create_chat()['id'])
+        research = ResearchResult.objects.create(politician=Politician.objects.create(name="Jane Doe"), position="Senator")
+
+        with mock.patch('chat.views.AsyncResult') as async_result:
+            async_result.return_value.ready.return_value = True
+            async_result.return_value.successful.return_value = True
+            async_result.return_value.result = {'research_id': research.id}
+            _attach_finished_research(chat)
 
-# Create your tests here.
+        saved = Chat.objects.get(id=chat.id)
+        self.assertEqual(saved.research_report_id, research.id)
+        self.assertEqual(saved.research_task_id, '')
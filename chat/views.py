@@ -1,3 +1,6 @@
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -6,10 +9,29 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from .models import Chat, QandA
 from .serializers import ChatSerializer, QandASerializer
-from research.models import ResearchResult, Politician
+from research.models import ResearchResult, ResearchSource, Politician
 from accounts.auth_utils import get_user_from_token
 from research.services.llm_service import LLMService
 from research.services.search_service import SearchService
+from celery.result import AsyncResult
+
+
+def _attach_finished_research(chat):
+    """
+    Attach the report of a finished research task to a chat still waiting on it.
+    
+    research_politician_task attaches the report itself, this only covers a task
+    that finished before the chat was saved.
+    """
+    if chat.research_report_id or not chat.research_task_id:
+        return
+    task = AsyncResult(chat.research_task_id)
+    if not task.ready():
+        return
+    result = task.result if task.successful() and isinstance(task.result, dict) else {}
+    chat.research_report_id = result.get('research_id')
+    chat.research_task_id = ''
+    chat.save(update_fields=['research_report', 'research_task_id', 'updated_at'])
 
 class ChatView(APIView):
     """
@@ -54,22 +76,32 @@ class ChatView(APIView):
             response = research_politician(mock_request, politician_name)
 
             # Get the research result ID from the response
+            research_task_id = ''
             if hasattr(response, 'data') and 'id' in response.data:
                 research_report_id = response.data['id']
                 research_report = ResearchResult.objects.get(id=research_report_id)
+            elif response.status_code == status.HTTP_202_ACCEPTED:
+                # New research was queued; the task attaches the report to
+                # the chat when it finishes, clients poll with research_task_id
+                research_report = None
+                research_task_id = response.data['task_id']
             else:
                 research_report = None
 
         except Exception as e:
             # If research API call fails, continue without research report
             research_report = None
+            research_task_id = ''
 
         # Create the chat
         chat = Chat.objects.create(
             politician=politician_name,
             user=user,
-            research_report=research_report
+            research_report=research_report,
+            research_task_id=research_task_id
         )
+        if research_task_id:
+            _attach_finished_research(chat)
 
         serializer = ChatSerializer(chat)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -89,8 +121,9 @@ class ChatView(APIView):
         # Apply pagination
         chats = chats[offset:offset+limit]
 
-        serializer = ChatSerializer(chats, many=True)
-        return Response(serializer.data)
+        # Output is read-only, so return rows as dicts without building
+        # model instances or running them through ChatSerializer
+        return Response(list(chats.values(*ChatSerializer.Meta.fields)))
 
 
 class TemporaryChatView(APIView):
@@ -110,8 +143,20 @@ class TemporaryChatView(APIView):
         try:
             # Get the temporary chat (user_id is None)
             chat = Chat.objects.get(id=chat_id, user=None)
-            serializer = ChatSerializer(chat)
-            return Response(serializer.data)
+            _attach_finished_research(chat)
+
+            # Skip serialization when the client's copy is still current
+            last_modified = int(chat.updated_at.timestamp())
+            if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+            if if_modified_since is not None and last_modified <= if_modified_since:
+                response = HttpResponseNotModified()
+            else:
+                serializer = ChatSerializer(chat)
+                response = Response(serializer.data)
+
+            response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(response, private=True, must_revalidate=True)
+            return response
         except Chat.DoesNotExist:
             return Response(
                 {'error': 'Temporary chat not found'}, 
@@ -129,21 +174,22 @@ class ChatDetailView(APIView):
     def delete(self, request, chat_id):
         """Delete a chat"""
         try:
-            chat = Chat.objects.get(id=chat_id)
+            # Only ownership is checked before deleting
+            chat = Chat.objects.only('id', 'user_id').get(id=chat_id)
 
             # Get user from token if available
             user = get_user_from_token(request)
 
             if user:
                 # Authenticated user can only delete their own chats
-                if chat.user != user:
+                if chat.user_id != user.id:
                     return Response(
                         {'error': 'You can only delete your own chats'}, 
                         status=status.HTTP_403_FORBIDDEN
                     )
             else:
                 # Unauthenticated user can only delete temporary chats (user=None)
-                if chat.user is not None:
+                if chat.user_id is not None:
                     return Response(
                         {'error': 'Authentication required to delete this chat'}, 
                         status=status.HTTP_401_UNAUTHORIZED
@@ -179,16 +225,19 @@ class QuestionView(APIView):
             )
 
         try:
-            chat = Chat.objects.get(id=chat_id)
+            chat = Chat.objects.only('id', 'research_report_id', 'research_task_id').get(id=chat_id)
+            _attach_finished_research(chat)
             
-            # Gather saved research as initial context
+            # Gather saved research as initial context, reading the sources
+            # by foreign key without loading the research report itself
             context_contents = []
-            if chat.research_report and getattr(chat.research_report, 'sources', None):
-                context_contents = [
-                    src['content']
-                    for src in chat.research_report.sources
-                    if src.get('content')
-                ]
+            if chat.research_report_id:
+                context_contents = list(
+                    ResearchSource.objects
+                    .filter(result_id=chat.research_report_id)
+                    .exclude(content='')
+                    .values_list('content', flat=True)
+                )
 
             # Include previous Q&A pairs as conversational history
             previous_messages = []
@@ -209,13 +258,16 @@ class QuestionView(APIView):
                 query_text = first.split("SEARCH_QUERY:", 1)[1].strip()
                 searcher = SearchService()
                 addl = []
-                for res in (searcher.search(query_text, num_results=3) or []):
-                    try:
-                        c = searcher.fetch_content(res['url'])
-                        if c:
-                            addl.append(c)
-                    except Exception:
-                        continue
+                try:
+                    for res in (searcher.search(query_text, num_results=3) or []):
+                        try:
+                            c = searcher.fetch_content(res['url'])
+                            if c:
+                                addl.append(c)
+                        except Exception:
+                            continue
+                finally:
+                    searcher.close()
                 # 3) Re-ask with expanded context
                 expanded = context_contents + addl
                 second = llm.answer_user_question(question, expanded)
@@ -237,7 +289,6 @@ class QuestionView(APIView):
 
             # Persist and return
             qanda = QandA.objects.create(chat=chat, question=question, answer=final or "")
-            qanda.save()
 
             serializer = QandASerializer(qanda)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -264,7 +315,7 @@ class ChatQandAView(APIView):
 
         try:
             # Check if the chat exists and belongs to the authenticated user
-            chat = Chat.objects.get(id=chat_id, user=request.user)
+            chat = Chat.objects.only('id').get(id=chat_id, user=request.user)
 
             # Get QandA sets for the chat with limit and offset in descending order
             qanda_sets = QandA.objects.filter(chat=chat).order_by('created_at')[offset:offset+limit]
@@ -0,0 +1,20 @@
+"""
+Celery application for the clara project.
+
+Workers are started with:
+    celery -A clara worker -l info
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'clara.settings')
+
+app = Celery('clara')
+
+# Read CELERY_* settings from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Discover tasks.py modules in installed apps
+app.autodiscover_tasks()
@@ -0,0 +1,17 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson instead of the stdlib json module.
+    Output matches DRF's compact UTF-8 JSON, including the "Z" suffix on
+    UTC datetimes; types orjson can't encode natively (lazy strings,
+    Decimal, querysets, ...) fall back to DRF's encoder.
+    """
+    _fallback = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._fallback, option=orjson.OPT_UTC_Z)
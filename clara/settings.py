@@ -56,6 +56,10 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'clara.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 # JWT settings
@@ -165,6 +169,42 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'stream': 'ext://sys.stdout',
+            'formatter': 'standard',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'INFO',
+    },
+    'loggers': {
+        'Research Pipeline': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'SearchService': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -174,6 +214,47 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 load_dotenv()
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY_2")
 
+# External service rate limits (queries per minute)
+GEMINI_QPM = int(os.environ.get("GEMINI_QPM", 60))
+GEMINI_MAX_CONCURRENT = int(os.environ.get("GEMINI_MAX_CONCURRENT", 4))
+SEARCH_QPM = int(os.environ.get("SEARCH_QPM", 30))
+
+# Web search backend: "google" scrapes results with googlesearch,
+# "serpapi" uses the SerpAPI JSON API (requires SERPAPI_API_KEY),
+# "google_cse" uses Google's Custom Search JSON API (requires
+# GOOGLE_CSE_API_KEY and GOOGLE_CSE_ID)
+SEARCH_ENGINE = os.environ.get("SEARCH_ENGINE", "google")
+SERPAPI_API_KEY = os.environ.get("SERPAPI_API_KEY")
+GOOGLE_CSE_API_KEY = os.environ.get("GOOGLE_CSE_API_KEY")
+GOOGLE_CSE_ID = os.environ.get("GOOGLE_CSE_ID")
+
+# Celery: research runs in a worker so requests don't block on the pipeline
+CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
+CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_RESULT_EXPIRES = 60 * 60 * 24
+CELERY_TASK_TRACK_STARTED = True
+
+# Cache: Redis when REDIS_URL is set, so every process shares cached
+# responses and research locks; otherwise a per-process in-memory cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
 ]
@@ -1,6 +1,11 @@
 #!/bin/bash
 set -e
 
+if [ "$1" = "worker" ]; then
+    echo "Starting Celery worker..."
+    exec celery -A clara worker --loglevel=info
+fi
+
 echo "Applying database migrations..."
 python manage.py migrate --noinput
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Politician, ResearchResult
+from .models import Politician, ResearchResult, ResearchSource
 
 @admin.register(Politician)
 class PoliticianAdmin(admin.ModelAdmin):
@@ -16,6 +16,14 @@ class PoliticianAdmin(admin.ModelAdmin):
     research_count.short_description = 'Number of research results'
 
 
+class ResearchSourceInline(admin.TabularInline):
+    model = ResearchSource
+    fields = ('url', 'title', 'query')
+    readonly_fields = ('url', 'title', 'query')
+    extra = 0
+    can_delete = False
+
+
 @admin.register(ResearchResult)
 class ResearchResultAdmin(admin.ModelAdmin):
     list_display = ('politician', 'position', 'created_at', 'updated_at', 'has_background', 'has_accomplishments', 'has_criticisms', 'has_summary')
@@ -23,6 +31,7 @@ class ResearchResultAdmin(admin.ModelAdmin):
     search_fields = ('politician__name', 'position', 'background', 'accomplishments', 'criticisms', 'summary')
     readonly_fields = ('created_at', 'updated_at')
     date_hierarchy = 'created_at'
+    inlines = (ResearchSourceInline,)
     fieldsets = (
         ('Politician', {
             'fields': ('politician', 'position')
@@ -31,7 +40,7 @@ class ResearchResultAdmin(admin.ModelAdmin):
             'fields': ('background', 'accomplishments', 'criticisms', 'summary'),
         }),
         ('Metadata', {
-            'fields': ('sources', 'created_at', 'updated_at'),
+            'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
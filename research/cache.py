@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.cache import cache
+import hashlib
+
+# Seconds to cache get_politicians / get_politician responses
+POLITICIANS_CACHE_TTL = 60
+POLITICIAN_CACHE_TTL = 300
+
+# Bumped on every write so all cached politician lists go stale at once
+POLITICIANS_VERSION_KEY = 'pols:version'
+
+# Seconds to keep a serialized ResearchResult; results are not edited
+# after the pipeline saves them and are invalidated on save anyway, so
+# this only bounds how long unread reports occupy the cache
+RESEARCH_RESULT_CACHE_TTL = 60 * 60 * 24
+
+# Seconds a queued research task holds the in-flight lock for its
+# politician and position; longer than any pipeline run should take
+RESEARCH_LOCK_TTL = 600
+
+# Seconds a queued research task id stays known to research_status;
+# matches how long Celery keeps the task result
+RESEARCH_TASK_TTL = settings.CELERY_RESULT_EXPIRES
+
+def _politicians_key_prefix(name_filter):
+    """Versioned key prefix shared by everything cached for a name filter."""
+    version = cache.get_or_set(POLITICIANS_VERSION_KEY, 0, None)
+    name_hash = hashlib.sha1(name_filter.encode('utf-8')).hexdigest()
+    return f"pols:{version}:{name_hash}"
+
+def politicians_cache_key(name_filter, limit, offset):
+    """Cache key for a page of get_politicians results."""
+    return f"{_politicians_key_prefix(name_filter)}:{limit}:{offset}"
+
+def politicians_count_key(name_filter):
+    """Cache key for the total number of politicians matching a name filter."""
+    return f"{_politicians_key_prefix(name_filter)}:count"
+
+def politician_cache_key(politician_id):
+    """Cache key for a get_politician response."""
+    return f"pol:{politician_id}"
+
+def research_result_cache_key(research_id, include_sources=True):
+    """Cache key for a serialized ResearchResult, with or without its sources."""
+    if include_sources:
+        return f"rr:{research_id}"
+    return f"rr:{research_id}:lite"
+
+def invalidate_politician_cache(politician_id):
+    """Drop the cached detail for a politician and every cached list page."""
+    cache.delete(politician_cache_key(politician_id))
+    try:
+        cache.incr(POLITICIANS_VERSION_KEY)
+    except ValueError:
+        cache.set(POLITICIANS_VERSION_KEY, 1, None)
+
+def research_lock_key(name, position):
+    """Cache key holding the id of the in-flight research task for a politician and position."""
+    lock_hash = hashlib.sha1(f"{name.strip().lower()}|{position.strip().lower()}".encode('utf-8')).hexdigest()
+    return f"research_lock:{lock_hash}"
+
+def research_task_key(task_id):
+    """Cache key marking a research task id as issued by research_politician."""
+    return f"research_task:{task_id}"
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from research.models import Politician
+from research.services.politician_service import PoliticianPipeline
+from research.services.search_service import WIKI_BATCH_SIZE
+
+class Command(BaseCommand):
+    help = 'Looks up images for politicians that do not have one yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=WIKI_BATCH_SIZE,
+            help='Number of politicians looked up per Wikipedia request'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        politicians = list(
+            Politician.objects.filter(Q(image_url__isnull=True) | Q(image_url='')).only('id', 'name', 'image_url')
+        )
+
+        pipeline = PoliticianPipeline()
+        updated = 0
+        try:
+            for i in range(0, len(politicians), batch_size):
+                updated += pipeline.enrich_images(politicians[i:i + batch_size])
+        finally:
+            pipeline.search_service.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Found images for {updated} of {len(politicians)} politicians')
+        )
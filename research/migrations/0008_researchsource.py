@@ -0,0 +1,69 @@
+# Generated by Django 5.2.1 on 2026-10-16 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_sources_to_table(apps, schema_editor):
+    ResearchResult = apps.get_model('research', 'ResearchResult')
+    ResearchSource = apps.get_model('research', 'ResearchSource')
+    for result_id, legacy_sources in ResearchResult.objects.values_list('id', 'legacy_sources').iterator():
+        if not isinstance(legacy_sources, list):
+            continue
+        ResearchSource.objects.bulk_create(
+            (
+                ResearchSource(
+                    result_id=result_id,
+                    url=source.get('url') or '',
+                    title=source.get('title') or '',
+                    query=source.get('query') or '',
+                    content=source.get('content') or '',
+                )
+                for source in legacy_sources
+                if isinstance(source, dict)
+            ),
+            batch_size=50,
+        )
+
+
+def copy_sources_to_json(apps, schema_editor):
+    ResearchResult = apps.get_model('research', 'ResearchResult')
+    for result in ResearchResult.objects.all().iterator():
+        result.legacy_sources = list(
+            result.sources.values('url', 'title', 'query', 'content')
+        )
+        result.save(update_fields=['legacy_sources'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0007_alter_politician_issues'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='researchresult',
+            old_name='sources',
+            new_name='legacy_sources',
+        ),
+        migrations.CreateModel(
+            name='ResearchSource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=2000)),
+                ('title', models.TextField(blank=True)),
+                ('query', models.CharField(blank=True, max_length=500)),
+                ('content', models.TextField(blank=True)),
+                ('result', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sources', to='research.researchresult')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.RunPython(copy_sources_to_table, copy_sources_to_json),
+        migrations.RemoveField(
+            model_name='researchresult',
+            name='legacy_sources',
+        ),
+    ]
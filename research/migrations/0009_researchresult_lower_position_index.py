@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-16 02:39
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0008_researchsource'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='researchresult',
+            index=models.Index(models.F('politician'), django.db.models.functions.text.Lower('position'), models.OrderBy(models.F('created_at'), descending=True), name='rr_pol_lower_pos_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-16 02:39
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research', '0009_researchresult_lower_position_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='politician',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='politician_lower_name_idx'),
+        ),
+    ]
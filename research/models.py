@@ -1,5 +1,11 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
+from datetime import timedelta
+
+# Allow case-insensitive lookups like position__lower='senator' that
+# compare LOWER(column) and can use functional indexes, unlike __iexact
+models.CharField.register_lookup(Lower)
 
 class Politician(models.Model):
     """
@@ -16,6 +22,8 @@ class Politician(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=['name']),
+            # Case-insensitive name lookups (name__lower=...)
+            models.Index(Lower('name'), name='politician_lower_name_idx'),
         ]
     
     def __str__(self):
@@ -23,6 +31,10 @@ class Politician(models.Model):
     
     def get_latest_research(self):
         """Get the most recent research for this politician"""
+        # Use the latest research prefetched by list views when available
+        prefetched = getattr(self, 'latest_research_list', None)
+        if prefetched is not None:
+            return prefetched[0] if prefetched else None
         return self.research_results.order_by('-created_at').first()
 
 class ResearchResult(models.Model):
@@ -36,7 +48,6 @@ class ResearchResult(models.Model):
     accomplishments = models.TextField(blank=True)  
     criticisms = models.TextField(blank=True)
     summary = models.TextField(blank=True)
-    sources = models.JSONField(default=dict)  # Store source URLs and metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -45,11 +56,33 @@ class ResearchResult(models.Model):
             models.Index(fields=['-created_at']),
             models.Index(fields=['politician', '-created_at']),
             models.Index(fields=['position']),
+            # Latest research for a politician and position, matched case-insensitively
+            models.Index(
+                models.F('politician'), Lower('position'), models.F('created_at').desc(),
+                name='rr_pol_lower_pos_created_idx'
+            ),
         ]
     
     def __str__(self):
         return f"Research on {self.politician.name} ({self.position}) ({self.created_at.strftime('%Y-%m-%d')})"
     
     def is_recent(self, days=7):
-        """Check if this research is recent (within the specified number of days)"""
-        return (timezone.now() - self.created_at).days <= days
\ No newline at end of file
+        """Check if this research is recent (younger than the specified number of days)"""
+        return timezone.now() - self.created_at < timedelta(days=days)
+
+class ResearchSource(models.Model):
+    """
+    Stores a web source gathered for a research result.
+    Kept in its own table so ResearchResult rows stay small.
+    """
+    result = models.ForeignKey(ResearchResult, on_delete=models.CASCADE, related_name='sources')
+    url = models.URLField(max_length=2000)
+    title = models.TextField(blank=True)
+    query = models.CharField(max_length=500, blank=True)
+    content = models.TextField(blank=True)
+    
+    class Meta:
+        ordering = ['id']
+    
+    def __str__(self):
+        return f"Source for research {self.result_id}: {self.url}"
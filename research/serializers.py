@@ -1,29 +1,66 @@
 from rest_framework import serializers
-from .models import Politician, ResearchResult
+from .models import Politician, ResearchResult, ResearchSource
+import copy
 
-class ResearchResultSerializer(serializers.ModelSerializer):
-    """Serializer for ResearchResult model"""
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class instead of on every
+    instantiation. Each instance binds copies, so the cached fields are
+    never modified; nested serializers are deep-copied so their child
+    serializers are bound to this instance, not shared with the cache.
+    Only use this on serializers whose fields don't depend on the
+    instance or context.
+    """
+    _fields_cache = {}
+    
+    def get_fields(self):
+        fields = CachedFieldsMixin._fields_cache.get(type(self))
+        if fields is None:
+            fields = CachedFieldsMixin._fields_cache[type(self)] = super().get_fields()
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in fields.items()
+        }
+
+class ResearchSourceSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Serializer for ResearchSource model"""
+    
+    class Meta:
+        model = ResearchSource
+        fields = ['url', 'title', 'query', 'content']
+        read_only_fields = fields
+
+class ResearchResultLiteSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Serializer for ResearchResult model without its sources"""
     
     class Meta:
         model = ResearchResult
+        fields = [
+            'id', 'position', 'background', 'accomplishments', 
+            'criticisms', 'summary', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+
+class ResearchResultSerializer(ResearchResultLiteSerializer):
+    """Serializer for ResearchResult model"""
+    
+    sources = ResearchSourceSerializer(many=True, read_only=True)
+    
+    class Meta(ResearchResultLiteSerializer.Meta):
         fields = [
             'id', 'position', 'background', 'accomplishments', 
             'criticisms', 'summary', 'sources', 'created_at', 'updated_at'
         ]
+        read_only_fields = fields
 
-class PoliticianSerializer(serializers.ModelSerializer):
+class PoliticianSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Politician model"""
     
-    # Include the latest research result as a nested serializer
-    latest_research = serializers.SerializerMethodField()
+    # Include the latest research result as a nested serializer; declared
+    # as a field so a many=True list reuses one child serializer for all rows
+    latest_research = ResearchResultSerializer(source='get_latest_research', read_only=True)
     
     class Meta:
         model = Politician
         fields = ['id', 'name', 'image_url', 'party', 'bio', 'created_at', 'latest_research']
-    
-    def get_latest_research(self, obj):
-        """Get the latest research for this politician"""
-        latest = obj.get_latest_research()
-        if latest:
-            return ResearchResultSerializer(latest).data
-        return None
\ No newline at end of file
+        read_only_fields = fields
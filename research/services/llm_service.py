@@ -4,8 +4,10 @@ import json
 from typing import List, Dict, Any, Optional
 import google.generativeai as genai
 from google.generativeai.types import GenerationConfig
+from google.api_core.exceptions import ResourceExhausted
 from django.conf import settings
 from .prompt_service import PromptService
+from .rate_limiter import llm_limiter, call_with_backoff
 
 # Set up logger for this module
 logger = logging.getLogger("LLM Service")
@@ -67,7 +69,12 @@ class LLMService:
             
             # Generate content
             logger.info("Generating content from Gemini...")
-            response = model.generate_content(prompt)
+            with llm_limiter:
+                response = call_with_backoff(
+                    model.generate_content,
+                    prompt,
+                    retry_on=(ResourceExhausted,)
+                )
             
             # Process and return the response
             if response.candidates and response.candidates[0].content:
@@ -207,7 +214,7 @@ class LLMService:
         
         return result.get("response", "No criticisms information available.")
     
-    def analyze_politician_summary(self, name: str, position: str, background: str, accomplishments: str, criticisms: str, content_list: List[str]) -> str:
+    def analyze_politician_summary(self, name: str, position: str, background: str, accomplishments: str, criticisms: str, content_list: List[str], content_text: Optional[str] = None) -> str:
         """
         Create a summary judgment for a politician using all prior analyses.
         
@@ -218,18 +225,15 @@ class LLMService:
         - accomplishments: Accomplishments analysis text
         - criticisms: Criticisms analysis text
         - content_list: List of text content for additional context
+        - content_text: Optional pre-rendered context from prepare_summary_content
         
         Returns:
         - String containing the summary judgment
         """
         logger.info(f"Creating summary judgment for politician: {name} ({position})")
         
-        # Use a smaller subset of content for additional context if provided
-        content_text = ""
-        if content_list:
-            # Use just a small sample for additional context since we already have the analyses
-            sample_content = content_list[:min(3, len(content_list))]
-            content_text = self._prepare_content_for_analysis(sample_content, max_chars=20000)
+        if content_text is None:
+            content_text = self.prepare_summary_content(content_list)
         
         prompt = self.prompt_service.get_prompt(
             'politician_summary',
@@ -248,6 +252,19 @@ class LLMService:
         
         return result.get("response", "No summary judgment available.")
     
+    def prepare_summary_content(self, content_list: List[str]) -> str:
+        """
+        Prepare the additional context used by the summary judgment prompt.
+        
+        This does not depend on the other analyses, so callers can render it
+        while those are still running.
+        """
+        if not content_list:
+            return ""
+        # Use just a small sample for additional context since we already have the analyses
+        sample_content = content_list[:min(3, len(content_list))]
+        return self._prepare_content_for_analysis(sample_content, max_chars=20000)
+    
     def _prepare_content_for_analysis(self, content_list: List[str], max_chars: int = 1000000) -> str:
         """Helper method to prepare content for analysis with consistent formatting"""
         content_text = "\n\n".join([f"Document {i+1}: {content[:5000]}" for i, content in enumerate(content_list)])
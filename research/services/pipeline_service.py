@@ -1,25 +1,27 @@
 from django.conf import settings
-from .search_service import SearchService
+from django.db import transaction
+from .search_service import SearchService, FETCH_WORKERS
 from .llm_service import LLMService
 from .politician_service import PoliticianPipeline
-from ..models import Politician, ResearchResult
+from ..models import Politician, ResearchResult, ResearchSource
 import logging
-import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Union
 from django.utils import timezone
 from .prompt_service import PromptService
 
-# Set up logging with UTF-8 encoding
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Handlers and levels are configured via settings.LOGGING
 logger = logging.getLogger("Research Pipeline")
 
+# Maximum number of search queries in flight at once; Google queries are
+# additionally spaced out by the shared search rate limiter
+SEARCH_WORKERS = 4
+
+# Holds one pipeline per thread, see get_pipeline()
+_local = threading.local()
+
 class ResearchPipeline:
     """
     Pipeline for researching politicians by orchestrating
@@ -60,6 +62,8 @@ class ResearchPipeline:
         Parameters:
         - name: Politician name (will be normalized)
         - position: Required position for this research
+        - max_age: Existing research younger than this many days is returned
+          instead of researching again; 0 always researches
     
         Returns:
         - ResearchResult instance with the analysis
@@ -68,8 +72,7 @@ class ResearchPipeline:
             logger.info(f"Starting research pipeline for politician: {name} ({position})")
             
             # Step 0: Normalize the politician name
-            search_service = SearchService()
-            normalized_name, wiki_url = search_service.normalize_politician_name(name, position)
+            normalized_name, wiki_url = self.search_service.normalize_politician_name(name, position)
             
             if normalized_name != name:
                 logger.info(f"Using normalized name: {normalized_name} (original: {name})")
@@ -86,7 +89,7 @@ class ResearchPipeline:
                 try:
                     existing_research = ResearchResult.objects.filter(
                         politician=politician,
-                        position__iexact=position
+                        position__lower=position.lower()
                     ).order_by('-created_at').first()
                     
                     if existing_research and existing_research.is_recent(days=max_age):
@@ -109,14 +112,25 @@ class ResearchPipeline:
             search_queries = self.search_service.generate_search_queries(name, position)
             logger.info(f"Generated {len(search_queries)} search queries")
             
-            # Step 3: Search for content
+            # Step 3: Search for content, fetching each page only once
+            # even when several queries return it
+            self.search_service.clear_seen()
             all_search_results = []
-            for query in search_queries:
-                results = self.search_service.search(query, num_results=2)
-                if results:
-                    for result in results:
+            seen_urls = set()
+            with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+                # Queries run concurrently; results are collected in query order
+                search_runs = executor.map(
+                    lambda query: self.search_service.search(query, num_results=2, skip_seen=True),
+                    search_queries
+                )
+                for query, results in zip(search_queries, search_runs):
+                    for result in results or []:
+                        # Concurrent queries can still race to the same page
+                        if result['url'] in seen_urls:
+                            continue
+                        seen_urls.add(result['url'])
                         result['query'] = query  # Track which query led to this result
-                    all_search_results.extend(results)
+                        all_search_results.append(result)
             
             logger.info(f"Found {len(all_search_results)} search results")
             
@@ -124,11 +138,12 @@ class ResearchPipeline:
             content_list = []
             extracted_content_texts = []
             
-            for result in all_search_results: 
-                content = self.search_service.fetch_content(result['url'])
-                
+            with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(all_search_results)))) as executor:
+                contents = list(executor.map(self.search_service.fetch_content, [result['url'] for result in all_search_results]))
+            
+            for result, content in zip(all_search_results, contents): 
                 if not content or len(content.strip()) < 500:
-                    logger.info(f"Skipping URL with insufficient content: {result['url']}")
+                    logger.debug("Skipping URL with insufficient content: %s", result['url'])
                     continue
                 
                 content_dict = {
@@ -145,59 +160,76 @@ class ResearchPipeline:
                 try:
                     logger.info(f"Starting multi-part analysis for {name} with LLM using {len(extracted_content_texts)} content sources")
                     
-                    # Background analysis
-                    logger.info("Step 5.1: Analyzing background")
-                    background = self.llm_service.analyze_politician_background(
-                        name=name, 
-                        position=position, 
-                        content_list=extracted_content_texts
-                    )
-                    
-                    # Accomplishments analysis
-                    logger.info("Step 5.2: Analyzing accomplishments")
-                    accomplishments = self.llm_service.analyze_politician_accomplishments(
-                        name=name, 
-                        position=position, 
-                        content_list=extracted_content_texts
-                    )
-                    
-                    # Criticisms analysis
-                    logger.info("Step 5.3: Analyzing criticisms")
-                    criticisms = self.llm_service.analyze_politician_criticisms(
-                        name=name, 
-                        position=position, 
-                        content_list=extracted_content_texts
-                    )
+                    # Background, accomplishments and criticisms are independent,
+                    # so run them concurrently instead of back to back
+                    with ThreadPoolExecutor(max_workers=3) as executor:
+                        logger.debug("Step 5.1: Analyzing background")
+                        background_future = executor.submit(
+                            self.llm_service.analyze_politician_background,
+                            name=name, 
+                            position=position, 
+                            content_list=extracted_content_texts
+                        )
+                        
+                        logger.debug("Step 5.2: Analyzing accomplishments")
+                        accomplishments_future = executor.submit(
+                            self.llm_service.analyze_politician_accomplishments,
+                            name=name, 
+                            position=position, 
+                            content_list=extracted_content_texts
+                        )
+                        
+                        logger.debug("Step 5.3: Analyzing criticisms")
+                        criticisms_future = executor.submit(
+                            self.llm_service.analyze_politician_criticisms,
+                            name=name, 
+                            position=position, 
+                            content_list=extracted_content_texts
+                        )
+                        
+                        # The summary's source sample doesn't depend on the analyses,
+                        # so render it while they are in flight
+                        summary_content_text = self.llm_service.prepare_summary_content(extracted_content_texts)
+                        
+                        background = background_future.result()
+                        accomplishments = accomplishments_future.result()
+                        criticisms = criticisms_future.result()
                     
                     # Summary judgment (using all previous analyses)
-                    logger.info("Step 5.4: Creating summary judgment")
+                    logger.debug("Step 5.4: Creating summary judgment")
                     summary = self.llm_service.analyze_politician_summary(
                         name=name, 
                         position=position,
                         background=background,
                         accomplishments=accomplishments,
                         criticisms=criticisms,
-                        content_list=extracted_content_texts
+                        content_list=extracted_content_texts,
+                        content_text=summary_content_text
                     )
                     
-                    # Step 6: Create and save research result
-                    research_result = ResearchResult.objects.create(
-                        politician=politician,
-                        position=position,
-                        background=background,
-                        accomplishments=accomplishments,
-                        criticisms=criticisms,
-                        summary=summary,
-                        sources=[
-                            {
-                                'url': content['url'],
-                                'title': content['title'],
-                                'query': content['query'],
-                                'content': content['content'],
-                            } 
-                            for content in content_list 
-                        ]
-                    )
+                    # Step 6: Create and save research result with its sources
+                    with transaction.atomic():
+                        research_result = ResearchResult.objects.create(
+                            politician=politician,
+                            position=position,
+                            background=background,
+                            accomplishments=accomplishments,
+                            criticisms=criticisms,
+                            summary=summary
+                        )
+                        ResearchSource.objects.bulk_create(
+                            (
+                                ResearchSource(
+                                    result=research_result,
+                                    url=content['url'],
+                                    title=content['title'],
+                                    query=content['query'],
+                                    content=content['content'],
+                                )
+                                for content in content_list
+                            ),
+                            batch_size=50
+                        )
                     
                     logger.info(f"Completed research for {name}")
                     return research_result
@@ -225,3 +257,17 @@ class ResearchPipeline:
                 "position": position,
                 "error": str(e)
             }
+
+
+def get_pipeline():
+    """
+    Get this thread's ResearchPipeline, creating it on first use.
+    
+    Reusing the pipeline keeps its HTTP session, Selenium driver and LLM
+    client alive between research runs. Each thread gets its own, since
+    a run resets the search service's per-run state.
+    """
+    pipeline = getattr(_local, 'pipeline', None)
+    if pipeline is None:
+        pipeline = _local.pipeline = ResearchPipeline()
+    return pipeline
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from ..models import Politician
 from .search_service import SearchService
@@ -15,6 +16,21 @@ class PoliticianPipeline:
     - policy positions/stances
     """
     
+    # Search query templates, formatted with the politician's name and position
+    PARTY_QUERY_TEMPLATES = (
+        "{name} political party affiliation",
+    )
+    BIO_QUERY_TEMPLATES = (
+        "{name} biography",
+        "{name} {position} profile",
+        "{name} career summary",
+    )
+    POLICY_QUERY_TEMPLATES = (
+        "{name} policy positions",
+        "{name} stance on issues",
+        "{name} {position} policies",
+    )
+    
     def __init__(self, search_service=None, llm_service=None):
         """
         Initialize the politician pipeline service.
@@ -67,9 +83,7 @@ class PoliticianPipeline:
         logger.info(f"Getting party affiliation for {name}")
         
         # Generate search queries for party information
-        party_queries = [
-            f"{name} political party affliation",
-        ]
+        party_queries = self._format_queries(self.PARTY_QUERY_TEMPLATES, name, position)
         
         # Search for party information
         party_content = self._search_and_extract_content(party_queries, 3)
@@ -97,16 +111,41 @@ class PoliticianPipeline:
         logger.warning(f"Could not find image for {name}")
         return ""
     
+    def enrich_images(self, politicians: List[Politician]) -> int:
+        """
+        Fill in missing image URLs for several politicians at once.
+        
+        Parameters:
+        - politicians: Politician instances; those that already have an image are skipped
+        
+        Returns:
+        - Number of politicians that were given an image
+        """
+        missing = [politician for politician in politicians if not politician.image_url]
+        if not missing:
+            return 0
+        
+        logger.info(f"Getting image URLs for {len(missing)} politicians")
+        images = self.search_service.search_politician_images_batch([politician.name for politician in missing])
+        
+        updated = 0
+        for politician in missing:
+            image_url = images.get(politician.name)
+            if image_url:
+                politician.image_url = image_url
+                # Saved one by one so the politician cache is invalidated
+                politician.save(update_fields=['image_url'])
+                updated += 1
+        
+        logger.info(f"Found images for {updated} of {len(missing)} politicians")
+        return updated
+    
     def get_short_bio(self, name: str, position: str) -> str:
         """Get a short biography for the politician"""
         logger.info(f"Getting short bio for {name}")
         
         # Generate search queries for biographical information
-        bio_queries = [
-            f"{name} biography",
-            f"{name} {position} profile",
-            f"{name} career summary"
-        ]
+        bio_queries = self._format_queries(self.BIO_QUERY_TEMPLATES, name, position)
         
         # Search for biographical information
         bio_content = self._search_and_extract_content(bio_queries, 1)
@@ -125,11 +164,7 @@ class PoliticianPipeline:
         logger.info(f"Getting policy stances for {name}")
         
         # Generate search queries for policy positions
-        policy_queries = [
-            f"{name} policy positions",
-            f"{name} stance on issues",
-            f"{name} {position} policies"
-        ]
+        policy_queries = self._format_queries(self.POLICY_QUERY_TEMPLATES, name, position)
         
         # Search for policy information
         policy_content = self._search_and_extract_content(policy_queries, 5)
@@ -143,6 +178,12 @@ class PoliticianPipeline:
         logger.warning(f"Could not determine policy stances for {name}")
         return {}
     
+    @staticmethod
+    def _format_queries(templates, name: str, position: str) -> List[str]:
+        """Fill a tuple of query templates with the politician's name and position"""
+        values = {'name': name, 'position': position}
+        return [template.format_map(values) for template in templates]
+    
     def _search_and_extract_content(self, queries: List[str], results_per_query: int = 3) -> List[str]:
         """Helper method to search and extract content for multiple queries"""
         all_content = []
@@ -151,9 +192,11 @@ class PoliticianPipeline:
             search_results = self.search_service.search(query, num_results=results_per_query)
             
             if search_results:
-                for result in search_results:
-                    content = self.search_service.fetch_content(result['url'])
-                    if content and len(content.strip()) > 100:
-                        all_content.append(content)
+                # Fetch the result pages concurrently, keeping search-rank order
+                with ThreadPoolExecutor(max_workers=len(search_results)) as executor:
+                    contents = executor.map(self.search_service.fetch_content, [result['url'] for result in search_results])
+                    for content in contents:
+                        if content and len(content.strip()) > 100:
+                            all_content.append(content)
         
         return all_content
\ No newline at end of file
@@ -1,10 +1,30 @@
 import os
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Any, Optional, Tuple
 from django.conf import settings
 
 logger = logging.getLogger("Prompt Service")
 
+_formatter = Formatter()
+
+
+@lru_cache(maxsize=64)
+def _read_prompt_file(full_path: str) -> str:
+    """Read a prompt file once per process; prompt files don't change at runtime."""
+    with open(full_path, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=64)
+def _compile_template(prompt_template: str) -> Tuple[Tuple[str, Optional[str], str, Optional[str]], ...]:
+    """
+    Parse a str.format-style template once into (literal, field, spec, conversion) parts
+    so repeated renders only do field substitution.
+    """
+    return tuple(_formatter.parse(prompt_template))
+
 class PromptService:
     """
     Service for managing and rendering prompts for LLM interactions.
@@ -52,10 +72,7 @@ class PromptService:
             )
             logger.info(f"Loading prompt from: {full_path}")
             
-            with open(full_path, 'r') as f:
-                prompt_template = f.read()
-            
-            return prompt_template
+            return _read_prompt_file(full_path)
             
         except Exception as e:
             logger.error(f"Error loading prompt from {prompt_name}: {str(e)}")
@@ -73,7 +90,15 @@ class PromptService:
         - The rendered prompt string
         """
         try:
-            rendered_prompt = prompt_template.format(**kwargs)
+            parts = []
+            for literal, field_name, format_spec, conversion in _compile_template(prompt_template):
+                parts.append(literal)
+                if field_name is not None:
+                    value = kwargs[field_name]
+                    if conversion:
+                        value = _formatter.convert_field(value, conversion)
+                    parts.append(format(value, format_spec))
+            rendered_prompt = "".join(parts)
             logger.debug(f"Rendered prompt length: {len(rendered_prompt)} characters")
             return rendered_prompt
             
@@ -0,0 +1,81 @@
+import logging
+import random
+import threading
+import time
+from django.conf import settings
+
+logger = logging.getLogger("Rate Limiter")
+
+class RateLimiter:
+    """
+    Thread-safe limiter for calls to an external service.
+    Caps the number of in-flight calls and spaces call starts so the
+    service's queries-per-minute budget is used without being exceeded.
+
+    Usage:
+        with limiter:
+            call_service()
+    """
+
+    def __init__(self, qpm: int, max_concurrent: int = None):
+        """
+        Initialize the rate limiter.
+
+        Parameters:
+        - qpm: Maximum queries per minute allowed by the service
+        - max_concurrent: Maximum calls in flight (defaults to qpm // 60 + 1)
+        """
+        self.qpm = qpm
+        self._min_interval = 60.0 / qpm
+        self._semaphore = threading.BoundedSemaphore(max_concurrent or qpm // 60 + 1)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._min_interval
+        if delay > 0:
+            time.sleep(delay)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._semaphore.release()
+        return False
+
+
+def call_with_backoff(func, *args, retry_on=(), max_retries: int = 3, base_delay: float = 1.0, **kwargs):
+    """
+    Call func, retrying with exponential backoff and jitter when it raises
+    one of the retry_on exceptions (e.g. a 429 from the provider).
+
+    Parameters:
+    - func: Callable to invoke
+    - retry_on: Tuple of exception types that should trigger a retry
+    - max_retries: Number of retries before the exception is re-raised
+    - base_delay: Delay in seconds before the first retry
+
+    Returns:
+    - The return value of func
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except retry_on as e:
+            if attempt >= max_retries:
+                raise
+            delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+            logger.warning(f"Rate limited ({str(e)[:50]}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+
+# Shared limiters, one per external service
+llm_limiter = RateLimiter(
+    qpm=getattr(settings, 'GEMINI_QPM', 60),
+    max_concurrent=getattr(settings, 'GEMINI_MAX_CONCURRENT', 4)
+)
+search_limiter = RateLimiter(qpm=getattr(settings, 'SEARCH_QPM', 30))
@@ -1,41 +1,315 @@
 from googlesearch import search
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
 import time
+from itertools import islice
 import re
-from urllib.parse import urlparse
+import codecs
+import hashlib
+import html
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urlparse, unquote
 import logging
-import sys
-
-# Set up logging with UTF-8 encoding
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from cachetools import TTLCache
+from django.conf import settings
+from django.core.cache import cache
+from concurrent.futures import ThreadPoolExecutor
+from .rate_limiter import search_limiter
+
+try:
+    import trafilatura
+except ImportError:  # Fall back to the BeautifulSoup heuristics
+    trafilatura = None
+
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:  # Skip the browser-impersonation fallback
+    curl_requests = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # Fall back to BeautifulSoup for parsing
+    HTMLParser = None
+
+# Handlers and levels are configured via settings.LOGGING
 logger = logging.getLogger("SearchService")
 
+BROWSER_UA = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Default headers for page fetches; the session sends these with every request.
+# ACCEPT_ENCODING lists only what urllib3 can decode here: gzip and deflate,
+# plus br/zstd when the brotli/zstandard packages are installed
+_SESSION_HEADERS = {
+    'User-Agent': BROWSER_UA,
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Wikipedia asks API clients to identify themselves
+WIKI_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; PoliticianResearchBot/1.0)'}
+
+# (connect, read) timeout for page fetches
+PAGE_TIMEOUT = (3.05, 10)
+# Timeout for Wikipedia API lookups
+WIKI_TIMEOUT = 5
+
+# Longest Retry-After (seconds) honoured before retrying a throttled page
+MAX_RETRY_AFTER = 10
+
+# Maximum bytes read from a page body; anything past this is never used
+MAX_PAGE_BYTES = 1024 * 1024
+# Title and snippet extraction only needs the top of the page
+SNIPPET_PAGE_BYTES = 256 * 1024
+# Read size while streaming a page body
+FETCH_CHUNK_BYTES = 64 * 1024
+
+# Content types worth downloading; anything else (PDFs, images, archives that
+# slipped past is_website_url) is skipped without reading the body
+_TEXT_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+
+# How long Wikipedia summaries are cached (seconds)
+WIKI_CACHE_TTL = 60 * 60 * 24
+
+# SerpAPI endpoint, used when search_engine is "serpapi"
+SERPAPI_URL = "https://serpapi.com/search.json"
+
+# Google Custom Search JSON API endpoint, used when search_engine is "google_cse"
+GOOGLE_CSE_URL = "https://www.googleapis.com/customsearch/v1"
+
+# MediaWiki action API, used to look up several pages in one request
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+# Pages per action-API request; the API's limit for intro extracts
+WIKI_BATCH_SIZE = 20
+
+# In-process cache of successful name normalizations, keyed on (name, position)
+_normalized_names = TTLCache(maxsize=2048, ttl=60 * 60)
+_normalized_names_lock = threading.Lock()
+
+# In-process caches of extracted page content and search snippets, keyed by URL;
+# snippets expire sooner since they mostly come from news and landing pages
+_content_cache = TTLCache(maxsize=512, ttl=60 * 60)
+_snippet_cache = TTLCache(maxsize=1024, ttl=15 * 60)
+_page_cache_lock = threading.Lock()
+
+# Maximum number of result pages fetched concurrently per search
+FETCH_WORKERS = 10
+
+# Minimum spacing (seconds) between requests to the same host; different
+# hosts are fetched in parallel without waiting on each other
+PER_HOST_INTERVAL = 1.0
+_host_next_slot = TTLCache(maxsize=4096, ttl=60)
+_host_lock = threading.Lock()
+
+# Maximum number of URLs remembered for duplicate filtering
+SEEN_URLS_MAXSIZE = 10000
+
+# File extensions that indicate a download rather than a web page
+_EXCLUDED_EXTS = frozenset({
+    'pdf', 'doc', 'docx', 'ppt', 'pptx', 'xls', 'xlsx',
+    'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'svg',
+    'mp3', 'mp4', 'avi', 'mov', 'wmv', 'flv', 'zip',
+    'rar', 'tar', 'gz', '7z'
+})
+
+# File extensions accepted as politician images
+_IMAGE_EXTS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'webp'})
+
+# Containers that usually hold a page's main content
+_CONTENT_SELECTOR = 'article, .article, .content, .post, main, #main, #content'
+
+# Elements whose presence means a JavaScript page has rendered its content
+_RENDERED_CONTENT_SELECTOR = 'article, main, #content, .content'
+
+# Tags whose text is never page content
+_NON_CONTENT_TAGS = ['script', 'style', 'noscript']
+
+# Words in an image's alt text or URL that suggest a portrait
+_RELEVANT_IMG_TERMS = ('portrait', 'headshot', 'photo', 'profile', 'politician')
+
+# Only <img> tags are needed when looking for a politician's photo
+_IMG_STRAINER = SoupStrainer('img')
+
+# Only <title> and <p> tags are needed for a search snippet
+_SNIPPET_STRAINER = SoupStrainer(['title', 'p'])
+
+# File names passed in query parameters, e.g. ?filename=report.pdf
+_FILE_QS_RE = re.compile(r'file(?:name|type)=.*\.(?:pdf|doc|jpg|png)', re.I)
+
+# Surnames too common in the Philippines to identify a politician on their own
+_COMMON_SURNAMES = frozenset({'garcia', 'santos', 'reyes', 'cruz', 'dela cruz', 'gonzales', 'bautista', 'lopez'})
+
+# Word stems that show an article is about someone in public office; matched
+# as token prefixes so "senators", "governor's" and "mayor-elect" count too
+_POLITICAL_TERMS = ('politician', 'mayor', 'governor', 'senator', 'congressman',
+                    'representative', 'official', 'elected')
+_POLITICAL_PHRASES = ('public servant',)
+_WORD_RE = re.compile(r"[a-z0-9'-]+")
+
+# Fast-path patterns for pulling a title and snippet out of raw page bytes
+_TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.I | re.S)
+_P_RE = re.compile(rb'<p(?:\s[^>]*)?>(.*?)</p>', re.I | re.S)
+_TAG_RE = re.compile(rb'<[^>]+>')
+# Markup probes used to tell JavaScript-rendered pages from genuinely short ones
+_ARTICLE_TAG_RE = re.compile(r'<(?:article|main)[\s>]', re.I)
+_P_TAG_RE = re.compile(r'<p[\s>]', re.I)
+_SCRIPT_TAG_RE = re.compile(r'<script[\s>]', re.I)
+
+# Markers of Cloudflare-style interstitials ("Just a moment...") served instead of the page
+_CHALLENGE_RE = re.compile(r'<title>\s*Just a moment\.\.\.|cf-browser-verification|challenge-platform', re.I)
+# One word of extracted text
+_NON_SPACE_RE = re.compile(r'\S+')
+
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+_WS_RE = re.compile(r'\s+')
+
+
+class _CappedRetry(Retry):
+    """Retry policy that honours Retry-After, but never waits longer than MAX_RETRY_AFTER."""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+@lru_cache(maxsize=4096)
+def _cached_parse(url):
+    """urlparse, memoized: the same URLs are parsed for filtering, throttling and link fixing."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def _classify_url(url):
+    """
+    Cached implementation of SearchService.is_website_url.
+    
+    Returns:
+    - The parsed URL if it is a website, None for relative URLs and file downloads
+    """
+    try:
+        # Skip relative URLs
+        if url.startswith('/'):
+            return None
+            
+        # Check parsed URL
+        parsed_url = _cached_parse(url)
+        
+        # Make sure it's a full URL with scheme and domain
+        if not parsed_url.scheme or not parsed_url.netloc:
+            return None
+        
+        # Check for file extensions in the path (one set lookup on the suffix)
+        path = parsed_url.path
+        dot = path.rfind('.')
+        if dot != -1 and path[dot + 1:].lower() in _EXCLUDED_EXTS:
+            return None
+        
+        # Check for file extension in query parameters
+        if _FILE_QS_RE.search(url):
+            return None
+            
+        return parsed_url
+    except ValueError:
+        # urlparse rejects malformed URLs such as an unclosed IPv6 host
+        return None
+
+
 class SearchService:
     """
     Service for searching information about politicians
     from web sources.
     """
     
-    def __init__(self, api_key=None, search_engine="google", debug=True):
+    # Research query templates, filled with the politician's name and position
+    SEARCH_QUERY_TEMPLATES = (
+        # Base queries about the politician
+        "{name} {position}",
+        "{name} politician background",
+        "{name} biography",
+        "{name} political career",
+        # Accomplishments queries
+        "{name} accomplishments",
+        "{name} legislation authored",
+        "{name} policy success",
+        # Criticism and controversy queries
+        "{name} controversy and scandal",
+        "{name} corruption allegations",
+        "{name} criticism",
+        "{name} ethics investigation",
+        # Background and history queries
+        "{name} education background",
+        "{name} political history",
+        "{name} family background",
+        "{name} business interests",
+        "{name} financial disclosure",
+    )
+    # Added only when a position is provided
+    POSITION_QUERY_TEMPLATES = (
+        "{name} {position} record",
+        "{name} {position} performance",
+        "{name} {position} tenure",
+        "{name} before {position}",
+    )
+    
+    def __init__(self, api_key=None, search_engine=None, debug=True):
         """
         Initialize the search service.
         
         Parameters:
-        - api_key: Optional API key for search service
-        - search_engine: Search engine to use (google, bing, etc.)
+        - api_key: Optional API key for search service (defaults to the
+          settings key for the chosen engine)
+        - search_engine: Search engine to use, "google", "serpapi" or "google_cse"
+          (defaults to settings.SEARCH_ENGINE)
         - debug: Enable debug mode
         """
-        self.api_key = api_key
-        self.search_engine = search_engine
+        self.search_engine = search_engine or getattr(settings, 'SEARCH_ENGINE', 'google')
+        if self.search_engine.lower() == "google_cse":
+            self.api_key = api_key or getattr(settings, 'GOOGLE_CSE_API_KEY', None)
+        else:
+            self.api_key = api_key or getattr(settings, 'SERPAPI_API_KEY', None)
+        self.cse_id = getattr(settings, 'GOOGLE_CSE_ID', None)
         self.debug = debug
-        logger.info(f"SearchService initialized with search_engine={search_engine}")
+        
+        # Number of lookups answered from cache, for observability
+        self._cache_hits = 0
+        # Number of normalizations resolved by the direct Wikipedia lookup,
+        # skipping context gathering and the LLM call
+        self._skip_llm_hits = 0
+        
+        # URLs already returned by searches run with skip_seen=True, oldest first
+        self._seen_urls = OrderedDict()
+        self._seen_lock = threading.Lock()
+        
+        # Headless Chrome for JavaScript-heavy pages, started lazily and reused
+        self._driver = None
+        self._driver_lock = threading.Lock()
+        
+        # Shared session so page fetches reuse pooled keep-alive connections
+        # and negotiate compressed responses
+        self._session = requests.Session()
+        self._session.headers.update(_SESSION_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=_CappedRetry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        logger.info(f"SearchService initialized with search_engine={self.search_engine}")
 
     def generate_search_queries(self, name, position):
         """
@@ -50,115 +324,63 @@ class SearchService:
         """
         logger.info(f"Generating search queries for: {name} ({position})")
         
-        # Base queries about the politician
-        base_queries = [
-            f"{name} {position}",
-            f"{name} politician background",
-            f"{name} biography",
-            f"{name} political career",
-        ]
+        unique_queries = list(self._build_search_queries(name, position))
         
-        # Accomplishments queries
-        accomplishment_queries = [
-            f"{name} accomplishments",
-            f"{name} legislation authored",
-            f"{name} policy success",
-        ]
-        
-        # Criticism and controversy queries
-        criticism_queries = [
-            f"{name} controversy and scandal",
-            f"{name} corruption allegations",
-            f"{name} criticism",
-            f"{name} ethics investigation",
-        ]
-        
-        # Background and history queries
-        background_queries = [
-            f"{name} education background",
-            f"{name} political history",
-            f"{name} family background",
-            f"{name} business interests",
-            f"{name} financial disclosure",
-        ]
-        
-        # Combine all queries
-        all_queries = base_queries + accomplishment_queries + criticism_queries + background_queries
+        logger.info(f"Generated {len(unique_queries)} search queries")
+        return unique_queries
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _build_search_queries(name, position):
+        """Build the de-duplicated query tuple for a politician; cached per (name, position)."""
+        templates = SearchService.SEARCH_QUERY_TEMPLATES
         
         # Add position-specific queries if position is provided
         if position and len(position.strip()) > 0:
-            position_queries = [
-                f"{name} {position} record",
-                f"{name} {position} performance",
-                f"{name} {position} tenure",
-                f"{name} before {position}",
-            ]
-            all_queries.extend(position_queries)
+            templates += SearchService.POSITION_QUERY_TEMPLATES
         
-        # Remove duplicates while preserving order
-        unique_queries = []
-        for query in all_queries:
-            if query not in unique_queries:
-                unique_queries.append(query)
+        values = {'name': name, 'position': position}
         
-        logger.info(f"Generated {len(unique_queries)} search queries")
-        return unique_queries
+        # Remove duplicates while preserving order
+        return tuple(dict.fromkeys(template.format_map(values) for template in templates))
     
     def is_website_url(self, url):
         """
         Check if URL is a website (not a PDF, image, or other file type)
         Returns True for website URLs, False for file downloads
         """
-        # File extensions to exclude
-        excluded_extensions = [
-            '.pdf', '.doc', '.docx', '.ppt', '.pptx', '.xls', '.xlsx',
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.svg',
-            '.mp3', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.zip',
-            '.rar', '.tar', '.gz', '.7z'
-        ]
-        
-        try:
-            # Skip relative URLs
-            if url.startswith('/'):
-                return False
-                
-            # Check parsed URL
-            parsed_url = urlparse(url)
-            
-            # Make sure it's a full URL with scheme and domain
-            if not parsed_url.scheme or not parsed_url.netloc:
-                return False
-                
-            path = parsed_url.path.lower()
-            
-            # Check for file extensions in the path
-            for ext in excluded_extensions:
-                if path.endswith(ext):
-                    return False
-            
-            # Check for file extension in query parameters
-            if re.search(r'file(name|type)=.*\.(pdf|doc|jpg|png)', url.lower()):
-                return False
-                
-            return True
-        except Exception:
-            return False
+        return _classify_url(url) is not None
         
-    def search(self, query, num_results=10):
+    def search(self, query, num_results=10, skip_seen=False):
         """
         Search for information using the specified query.
         
         Parameters:
         - query: Search query string
         - num_results: Number of results to return
+        - skip_seen: Skip URLs already returned by earlier skip_seen searches,
+          so pages found by several queries are only fetched once
         
         Returns:
         - List of search results, each containing url, title, and snippet
         """
         logger.info(f"Searching for: '{query}', num_results={num_results}")
         
-        if self.search_engine.lower() == "google":
-            results = self._google_search(query, num_results)
+        engine = self.search_engine.lower()
+        if engine == "serpapi" and not self.api_key:
+            logger.warning("No SerpAPI key configured, falling back to Google scraping")
+            engine = "google"
+        elif engine == "google_cse" and not (self.api_key and self.cse_id):
+            logger.warning("No Custom Search key or engine ID configured, falling back to Google scraping")
+            engine = "google"
+        
+        if engine in ("google", "serpapi", "google_cse"):
+            if engine == "serpapi":
+                results = self._serpapi_search(query, num_results, skip_seen)
+            elif engine == "google_cse":
+                results = self._google_cse_search(query, num_results, skip_seen)
+            else:
+                results = self._google_search(query, num_results, skip_seen)
             if results is None:
                 results = []
             # Add the query to the results for reference
@@ -170,7 +392,110 @@ class SearchService:
             logger.error(f"Search engine '{self.search_engine}' not supported")
             raise ValueError(f"Search engine '{self.search_engine}' not supported")
     
-    def _google_search(self, query, num_results=10):
+    def clear_seen(self):
+        """Forget the URLs remembered for skip_seen searches, e.g. between politicians."""
+        with self._seen_lock:
+            self._seen_urls.clear()
+    
+    def _is_seen(self, url):
+        """Check whether a URL was already returned by a skip_seen search."""
+        with self._seen_lock:
+            if url in self._seen_urls:
+                self._seen_urls.move_to_end(url)
+                return True
+            return False
+    
+    def _mark_seen(self, url):
+        """Remember a returned URL, evicting the least recently seen past the limit."""
+        with self._seen_lock:
+            self._seen_urls[url] = None
+            self._seen_urls.move_to_end(url)
+            if len(self._seen_urls) > SEEN_URLS_MAXSIZE:
+                self._seen_urls.popitem(last=False)
+    
+    def _serpapi_search(self, query, num_results=10, skip_seen=False):
+        """
+        Use the SerpAPI JSON API to perform a Google search.
+        Titles and snippets come back with the results, so no pages are fetched.
+        """
+        try:
+            params = {
+                'engine': 'google',
+                'q': query,
+                'num': num_results * 2,  # Extra results to account for filtered ones
+                'hl': 'en',
+                'api_key': self.api_key
+            }
+            with search_limiter:
+                response = self._session.get(SERPAPI_URL, params=params, timeout=PAGE_TIMEOUT)
+            response.raise_for_status()
+            
+            return self._collect_api_results(response.json().get('organic_results', []), num_results, skip_seen)
+            
+        except Exception as e:
+            logger.error(f"SerpAPI search error: {str(e)[:100]}")
+            return []
+    
+    def _google_cse_search(self, query, num_results=10, skip_seen=False):
+        """
+        Use Google's Custom Search JSON API to perform a search.
+        The API returns 10 results per call, so the needed pages are requested
+        concurrently. Titles and snippets come back with the results.
+        """
+        try:
+            # Extra results to account for filtered ones; the API serves at most 100
+            pages = min(3, -(-num_results * 2 // 10))
+            
+            def fetch_page(start):
+                params = {
+                    'key': self.api_key,
+                    'cx': self.cse_id,
+                    'q': query,
+                    'num': 10,
+                    'start': start,
+                    'hl': 'en'
+                }
+                with search_limiter:
+                    response = self._session.get(GOOGLE_CSE_URL, params=params, timeout=PAGE_TIMEOUT)
+                response.raise_for_status()
+                return response.json().get('items', [])
+            
+            with ThreadPoolExecutor(max_workers=pages) as executor:
+                items = [item for page in executor.map(fetch_page, (1, 11, 21)[:pages]) for item in page]
+            
+            return self._collect_api_results(items, num_results, skip_seen)
+            
+        except Exception as e:
+            logger.error(f"Custom Search error: {str(e)[:100]}")
+            return []
+    
+    def _collect_api_results(self, items, num_results, skip_seen=False):
+        """
+        Turn search API result items (with link, title and snippet) into
+        search results, applying the same URL filtering as scraped searches.
+        """
+        search_results = []
+        for item in items:
+            url = item.get('link', '')
+            if not url or not self.is_website_url(url):
+                continue
+            if skip_seen and self._is_seen(url):
+                continue
+            
+            search_results.append({
+                "url": url,
+                "title": item.get('title', "No title found"),
+                "snippet": item.get('snippet') or "No snippet available"
+            })
+            if skip_seen:
+                self._mark_seen(url)
+            if len(search_results) >= num_results:
+                break
+        
+        logger.info(f"Search complete: {len(search_results)} results")
+        return search_results
+    
+    def _google_search(self, query, num_results=10, skip_seen=False):
         """Use the googlesearch library to perform a Google search."""
         search_results = []
         skipped_count = 0
@@ -179,39 +504,51 @@ class SearchService:
         try:
             search_urls = []
             # Get more URLs than needed to account for filtered ones
-            for url in search(query, num_results=num_results*3, lang='en'):
-                if self.is_website_url(url):
-                    search_urls.append(url)
-                    if len(search_urls) >= num_results*2:  # Get twice as many as needed to account for errors
-                        break
-                else:
-                    skipped_count += 1
+            with search_limiter:
+                for url in search(query, num_results=num_results*3, lang='en'):
+                    if skip_seen and self._is_seen(url):
+                        skipped_count += 1
+                        continue
+                    if self.is_website_url(url):
+                        search_urls.append(url)
+                        if len(search_urls) >= num_results*2:  # Get twice as many as needed to account for errors
+                            break
+                    else:
+                        skipped_count += 1
             
             logger.info(f"Found {len(search_urls)} valid URLs (skipped {skipped_count})")
             
-            # Process each URL to get content
-            for url in search_urls:
-                if len(search_results) >= num_results:
-                    break
-                    
-                try:
-                    title, snippet = self._get_title_and_snippet(url)
-                    
-                    # Skip results with empty content
-                    if snippet and snippet.strip() != "No snippet available":
-                        search_results.append({
-                            "url": url,
-                            "title": title,
-                            "snippet": snippet
-                        })
-                        logger.info(f"Added result with URL: {url}")
-                    else:
-                        logger.info(f"Skipped URL with empty content: {url}")
-                except Exception as e:
-                    error_count += 1
-                    logger.info(f"Failed to get content from {url}: {str(e)[:50]}...")
+            # Fetch titles and snippets concurrently; results are still
+            # consumed in search-rank order
+            with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(search_urls)))) as executor:
+                futures = [executor.submit(self._get_title_and_snippet, url) for url in search_urls]
+                
+                for url, future in zip(search_urls, futures):
+                    if len(search_results) >= num_results:
+                        break
+                        
+                    try:
+                        title, snippet = future.result()
+                        
+                        # Skip results with empty content
+                        if snippet and snippet.strip() != "No snippet available":
+                            search_results.append({
+                                "url": url,
+                                "title": title,
+                                "snippet": snippet
+                            })
+                            if skip_seen:
+                                self._mark_seen(url)
+                            logger.debug("Added result with URL: %s", url)
+                        else:
+                            logger.debug("Skipped URL with empty content: %s", url)
+                    except Exception as e:
+                        error_count += 1
+                        logger.debug("Failed to get content from %s: %.50s...", url, e)
                 
-                time.sleep(1)  # Be respectful with rate limiting
+                # Don't fetch pages we no longer need
+                for future in futures:
+                    future.cancel()
             
             logger.info(f"Search complete: {len(search_results)} results, {error_count} errors")
             return search_results
@@ -221,38 +558,66 @@ class SearchService:
             return []
     
     def _get_title_and_snippet(self, url):
-        """Get the title and a snippet of text from a URL."""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        """Get the title and a snippet of text from a URL. Results are cached in-process."""
+        with _page_cache_lock:
+            cached = _snippet_cache.get(url)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
         
-        # Ensure we're working with UTF-8 text
-        if response.encoding is None or response.encoding.lower() == 'iso-8859-1':
-            response.encoding = 'utf-8'
+        title, snippet = self._fetch_title_and_snippet(url)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Pages without a usable snippet may have been blocked or half-loaded,
+        # so they are fetched again next time
+        if snippet != "No snippet available":
+            with _page_cache_lock:
+                _snippet_cache[url] = (title, snippet)
+        return title, snippet
+    
+    def _fetch_title_and_snippet(self, url):
+        """Uncached implementation of _get_title_and_snippet."""
+        content, encoding = self._fetch_capped(url, SNIPPET_PAGE_BYTES)
         
-        # Get title
-        title = soup.title.string.strip() if soup.title else "No title found"
+        # Fast path: read the title and paragraphs straight from the raw bytes
+        title, paragraphs = self._regex_title_and_paragraphs(content, encoding)
+        if paragraphs:
+            return title or "No title found", self._build_snippet(paragraphs)
         
-        # Get snippet (first few paragraphs or relevant text)
-        paragraphs = [p.get_text(strip=True) for p in soup.find_all('p') 
-                     if len(p.get_text(strip=True)) > 50]
+        page_html = content.decode(encoding, errors='replace')
         
-        if paragraphs:
-            # Join the first few paragraphs up to ~200 chars
-            snippet_text = ""
-            for p in paragraphs:
-                if len(snippet_text) < 200:
-                    snippet_text += p + " "
-                else:
-                    break
-            snippet = snippet_text[:250] + "..." if len(snippet_text) > 250 else snippet_text
+        if HTMLParser is not None:
+            tree = self._parse_html(page_html)
+            
+            # Get title
+            title_node = tree.css_first('title')
+            title = title_node.text(strip=True) if title_node else ""
+            
+            # Get snippet (first few paragraphs or relevant text); walk the tree
+            # lazily so the walk stops once the snippet is filled
+            nodes = tree.root.traverse() if tree.root else ()
+            texts = (node.text(strip=True) for node in nodes if node.tag == 'p')
         else:
+            # Only <title> and <p> are needed, so skip building the rest of the tree
+            soup = self._make_soup(page_html, parse_only=_SNIPPET_STRAINER)
+            
+            # Get title
+            title = soup.title.string.strip() if soup.title and soup.title.string else ""
+            
+            # Get snippet (first few paragraphs or relevant text), lazily as above
+            texts = (tag.get_text(strip=True) for tag in soup.descendants if tag.name == 'p')
+        
+        title = title or "No title found"
+        
+        # Paragraph texts are produced lazily, so only the paragraphs the
+        # snippet actually uses are extracted
+        snippet = self._build_snippet(t for t in texts if len(t) > 50)
+        if not snippet:
             # Fallback to any text content
-            all_text = soup.get_text(separator=' ', strip=True)
+            if HTMLParser is not None:
+                all_text = self._tree_text(tree)
+            else:
+                # The strained tree only holds <title> and <p>; parse the full page
+                all_text = self._make_soup(page_html).get_text(separator=' ', strip=True)
             snippet = all_text[:250] + "..." if len(all_text) > 250 else all_text
         
         if not snippet or snippet.strip() == "":
@@ -260,6 +625,49 @@ class SearchService:
             
         return title, snippet
     
+    @staticmethod
+    def _regex_title_and_paragraphs(content, encoding='utf-8'):
+        """
+        Extract the title and paragraphs longer than 50 characters from raw
+        HTML bytes without building a parse tree.
+        
+        Returns:
+        - Tuple of (title or None, list of paragraph strings)
+        """
+        def to_text(raw):
+            text = _TAG_RE.sub(b' ', raw).decode(encoding, errors='replace')
+            return _WS_RE.sub(' ', html.unescape(text)).strip()
+        
+        match = _TITLE_RE.search(content)
+        title = to_text(match.group(1)) if match else None
+        
+        paragraphs = []
+        for match in _P_RE.finditer(content):
+            text = to_text(match.group(1))
+            if len(text) > 50:
+                paragraphs.append(text)
+                # The snippet never needs more than a few paragraphs
+                if sum(map(len, paragraphs)) >= 200:
+                    break
+        
+        return title, paragraphs
+    
+    @staticmethod
+    def _build_snippet(paragraphs):
+        """
+        Join the first few paragraphs up to ~200 chars, capped at 250.
+        Consumes only as many items as needed, so paragraphs may be a generator.
+        """
+        selected = []
+        length = 0
+        for p in paragraphs:
+            selected.append(p)
+            length += len(p) + 1
+            if length >= 200:
+                break
+        snippet_text = ' '.join(selected) + ' ' if selected else ""
+        return snippet_text[:250] + "..." if len(snippet_text) > 250 else snippet_text
+    
     def fetch_content(self, url):
         """
         Fetch and extract content from a URL.
@@ -270,23 +678,42 @@ class SearchService:
         Returns:
         - Extracted content as text
         """
-        logger.info(f"Fetching content from: {url}")
+        logger.debug("Fetching content from: %s", url)
+        
+        with _page_cache_lock:
+            cached = _content_cache.get(url)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
         
         try:
             # Try with requests first
-            content = self._scrape_with_requests(url)
+            content, needs_js = self._scrape_with_requests(url)
             
-            # If we got empty content or mostly ads, try with Selenium
-            if not content or len(content.split()) < 100:
+            # If we got empty content or mostly ads, the site may be blocking
+            # non-browser TLS clients; retry impersonating Chrome's TLS fingerprint
+            if self._is_limited(content) and needs_js and curl_requests is not None:
                 if self.debug:
-                    logger.info(f"Limited content with requests, trying Selenium for {url}")
+                    logger.debug("Limited content with requests, trying curl_cffi for %s", url)
+                content, needs_js = self._scrape_with_curl_cffi(url)
+            
+            # Only start a browser when the page looks like it renders with
+            # JavaScript; genuinely short pages are returned as they are
+            if self._is_limited(content) and needs_js:
+                if self.debug:
+                    logger.debug("Limited content, trying Selenium for %s", url)
                 content = self._scrape_with_selenium(url)
             
+            if logger.isEnabledFor(logging.DEBUG):
+                if content:
+                    logger.debug("Extracted %d characters from %s", len(content), url)
+                else:
+                    logger.debug("No content extracted from %s", url)
+            
+            # Only remember pages that produced content; failures may be transient
             if content:
-                content_length = len(content)
-                logger.info(f"Extracted {content_length} characters from {url}")
-            else:
-                logger.info(f"No content extracted from {url}")
+                with _page_cache_lock:
+                    _content_cache[url] = content
                 
             return content
             
@@ -294,48 +721,240 @@ class SearchService:
             logger.error(f"Error fetching content: {str(e)[:100]}")
             return ""
     
+    @staticmethod
+    def _wait_for_host(url):
+        """Space out requests to the same host by PER_HOST_INTERVAL seconds."""
+        host = _cached_parse(url).netloc
+        with _host_lock:
+            now = time.monotonic()
+            slot = max(now, _host_next_slot.get(host, 0.0))
+            _host_next_slot[host] = slot + PER_HOST_INTERVAL
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _fetch_capped(self, url, max_bytes):
+        """
+        Download at most max_bytes of a page body.
+        
+        The body is streamed, so large pages stop downloading once the cap
+        is reached instead of being read in full.
+        
+        Returns:
+        - Tuple of (body bytes, text encoding); the body is empty for non-text responses
+        """
+        self._wait_for_host(url)
+        with self._session.get(url, timeout=PAGE_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('Content-Type', '').lower()
+            if content_type and not content_type.startswith(_TEXT_CONTENT_TYPES):
+                logger.debug("Skipping non-text response (%s) from %s", content_type, url)
+                return b'', 'utf-8'
+            
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=FETCH_CHUNK_BYTES):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= max_bytes:
+                    break
+            
+            body = b''.join(chunks)[:max_bytes]
+            encoding = self._resolve_encoding(response.encoding, body)
+        
+        return body, encoding
+    
+    @staticmethod
+    def _resolve_encoding(declared, body):
+        """
+        Pick the charset for a page without running charset detection over the body.
+        
+        Uses the Content-Type charset, then a <meta> charset near the top of
+        the page, then UTF-8. ISO-8859-1 is requests' default when the header
+        has no charset, so it is treated as undeclared, and so is a header
+        charset Python has no codec for.
+        """
+        if declared and declared.lower() != 'iso-8859-1':
+            try:
+                return codecs.lookup(declared).name
+            except LookupError:
+                pass
+        
+        match = _META_CHARSET_RE.search(body, 0, 4096)
+        if match:
+            try:
+                return codecs.lookup(match.group(1).decode('ascii')).name
+            except (LookupError, UnicodeDecodeError):
+                pass
+        
+        return 'utf-8'
+    
     def _scrape_with_requests(self, url):
-        """Scrape content using requests and BeautifulSoup (for simple pages)"""
+        """
+        Scrape content using requests and trafilatura, selectolax or BeautifulSoup (for simple pages)
+        
+        Returns:
+        - Tuple of (extracted text, whether the page looks like it needs JavaScript)
+        """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            content, encoding = self._fetch_capped(url, MAX_PAGE_BYTES)
+            return self._scrape_html(content.decode(encoding, errors='replace'))
+        
+        except Exception as e:
+            if self.debug:
+                logger.debug("Error with requests: %.100s", e)
+            # Nothing was fetched, so a browser may still succeed
+            return "", True
+    
+    def _scrape_with_curl_cffi(self, url):
+        """
+        Scrape content with curl_cffi impersonating Chrome (for sites that block by TLS fingerprint)
+        
+        Returns:
+        - Tuple of (extracted text, whether the page looks like it needs JavaScript)
+        """
+        try:
+            self._wait_for_host(url)
+            response = curl_requests.get(url, impersonate='chrome', timeout=PAGE_TIMEOUT)
             
-            # Ensure we're working with UTF-8 text
-            if response.encoding is None or response.encoding.lower() == 'iso-8859-1':
-                response.encoding = 'utf-8'
+            body = response.content[:MAX_PAGE_BYTES]
+            encoding = self._resolve_encoding(response.encoding, body)
+            page_html = body.decode(encoding, errors='replace')
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # An anti-bot challenge that survived a browser TLS fingerprint
+            # won't be solved by headless Chrome either, so skip Selenium
+            if self._is_bot_challenge(response.headers, page_html):
+                logger.debug("Bot challenge served to curl_cffi for %s", url)
+                return "", False
             
-            # Try different content extraction strategies
-            # 1. Look for article or main content containers
-            content_containers = soup.select('article, .article, .content, .post, main, #main, #content')
+            response.raise_for_status()
+            return self._scrape_html(page_html)
+        
+        except Exception as e:
+            if self.debug:
+                logger.debug("Error with curl_cffi: %.100s", e)
+            return "", True
+    
+    def _scrape_html(self, page_html):
+        """Extract a fetched page's text, and judge whether short text means it renders with JavaScript."""
+        content = self._extract_main_text(page_html)
+        needs_js = self._is_limited(content) and self._looks_js_rendered(page_html)
+        return content, needs_js
+    
+    @staticmethod
+    def _looks_js_rendered(page_html):
+        """
+        Cheap check on raw HTML for pages that build their content with
+        JavaScript: scripts present, but no article/main element and almost
+        no paragraphs in the served markup.
+        """
+        if _ARTICLE_TAG_RE.search(page_html):
+            return False
+        if len(_P_TAG_RE.findall(page_html)) >= 5:
+            return False
+        return _SCRIPT_TAG_RE.search(page_html) is not None
+    
+    @staticmethod
+    def _is_bot_challenge(headers, page_html):
+        """Whether a response is a Cloudflare-style anti-bot challenge rather than the page."""
+        if headers.get('cf-mitigated', '').lower() == 'challenge':
+            return True
+        return _CHALLENGE_RE.search(page_html, 0, 16384) is not None
+    
+    @staticmethod
+    def _is_limited(content):
+        """Whether scraped content is empty or too short to be the page's main text."""
+        if not content:
+            return True
+        # Count words only until the threshold, instead of splitting the whole text
+        return next(islice(_NON_SPACE_RE.finditer(content), 99, None), None) is None
+    
+    def _extract_main_text(self, page_html):
+        """
+        Extract the main text of a fetched page.
+        Prefers trafilatura's main-text extraction, which skips navigation and
+        ads and is faster than building a full soup, then falls back to
+        _extract_from_html.
+        """
+        if trafilatura is not None:
+            extracted = trafilatura.extract(
+                page_html,
+                include_comments=False,
+                include_tables=False,
+                no_fallback=True
+            )
+            if extracted:
+                return extracted
+        
+        return self._extract_from_html(page_html)
+    
+    def _extract_from_html(self, page_html):
+        """
+        Extract the readable text of a page, shared by the requests and
+        Selenium scrapers. Uses selectolax when installed, else BeautifulSoup.
+        
+        Strategies, in order:
+        1. Text of article or main content containers
+        2. Paragraphs longer than 100 characters (shorter ones are likely ads or navigation)
+        3. All text on the page
+        """
+        if HTMLParser is not None:
+            tree = self._parse_html(page_html)
+            
+            content_containers = tree.css(_CONTENT_SELECTOR)
             if content_containers:
-                return ' '.join([container.get_text(separator=' ', strip=True) for container in content_containers])
+                return ' '.join([container.text(separator=' ', strip=True) for container in content_containers])
             
-            # 2. Get all paragraphs, excluding ones that might be ads or navigation
-            paragraphs = [p.get_text(strip=True) for p in soup.find_all('p') 
-                         if len(p.get_text(strip=True)) > 100]  # Filter out short paragraphs likely to be ads
+            texts = (p.text(strip=True) for p in tree.css('p'))
+            paragraphs = [t for t in texts if len(t) > 100]
             if paragraphs:
                 return ' '.join(paragraphs)
-                
-            # 3. Fallback: get general text content
-            return soup.get_text(separator=' ', strip=True)
+            
+            return self._tree_text(tree)
         
-        except Exception as e:
-            if self.debug:
-                logger.info(f"Error with requests: {str(e)[:100]}")
-            return ""
-    
-    def _scrape_with_selenium(self, url):
-        """Scrape content using Selenium (for JavaScript-heavy pages)"""
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
+        soup = self._make_soup(page_html)
+        
+        content_containers = soup.select(_CONTENT_SELECTOR)
+        if content_containers:
+            return ' '.join([container.get_text(separator=' ', strip=True) for container in content_containers])
+        
+        texts = (p.get_text(strip=True) for p in soup.find_all('p'))
+        paragraphs = [t for t in texts if len(t) > 100]
+        if paragraphs:
+            return ' '.join(paragraphs)
         
-        driver = None
+        return soup.get_text(separator=' ', strip=True)
+    
+    @staticmethod
+    def _make_soup(markup, **kwargs):
+        """Build a BeautifulSoup tree with lxml, falling back to html.parser if lxml is unavailable."""
         try:
+            return BeautifulSoup(markup, 'lxml', **kwargs)
+        except FeatureNotFound:
+            return BeautifulSoup(markup, 'html.parser', **kwargs)
+    
+    @staticmethod
+    def _parse_html(page_html):
+        """Parse a page with selectolax, dropping script and style text like BeautifulSoup's get_text."""
+        tree = HTMLParser(page_html)
+        tree.strip_tags(_NON_CONTENT_TAGS)
+        return tree
+    
+    @staticmethod
+    def _tree_text(tree):
+        """All visible text of a selectolax tree, space separated."""
+        root = tree.body or tree.root
+        return root.text(separator=' ', strip=True) if root else ""
+    
+    def _get_driver(self):
+        """
+        Return the shared headless Chrome driver, starting it on first use.
+        Callers must hold self._driver_lock.
+        """
+        if self._driver is None:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            
             # Set up headless Chrome browser
             chrome_options = Options()
             chrome_options.add_argument("--headless")
@@ -345,44 +964,70 @@ class SearchService:
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-popup-blocking")
             chrome_options.add_argument('--blink-settings=imagesEnabled=false')
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            # Initialize the Chrome driver
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get(url)
-            # Wait for JavaScript to load content
-            time.sleep(2)
+            chrome_options.add_argument("--window-size=1280,800")
+            chrome_options.add_argument(f"--user-agent={BROWSER_UA}")
+            # Return from driver.get() at DOMContentLoaded instead of waiting for onload
+            chrome_options.page_load_strategy = 'eager'
             
-            # Get the page source and parse with BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Try different content extraction strategies
-            content_containers = soup.select('article, .article, .content, .post, main, #main, #content')
-            if content_containers:
-                return ' '.join([container.get_text(separator=' ', strip=True) for container in content_containers])
+            self._driver = webdriver.Chrome(options=chrome_options)
+            self._driver.set_page_load_timeout(15)
+        return self._driver
+    
+    def _quit_driver(self):
+        """Shut down the shared Chrome driver, if running. Callers must hold self._driver_lock."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+    
+    def _scrape_with_selenium(self, url):
+        """Scrape content using Selenium (for JavaScript-heavy pages)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
+        try:
+            # Reuse one browser across calls; starting Chrome costs seconds
+            with self._driver_lock:
+                try:
+                    driver = self._get_driver()
+                    driver.get(url)
+                    # Wait until JavaScript has rendered some content, rather than a fixed delay
+                    try:
+                        WebDriverWait(driver, 5).until(EC.any_of(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, _RENDERED_CONTENT_SELECTOR)),
+                            EC.presence_of_element_located((By.TAG_NAME, 'p'))
+                        ))
+                    except TimeoutException:
+                        pass  # Parse whatever has loaded so far
+                    page_source = driver.page_source
+                except WebDriverException:
+                    # The browser may have crashed or hung; start a fresh one next time
+                    self._quit_driver()
+                    raise
             
-            paragraphs = [p.get_text(strip=True) for p in soup.find_all('p') 
-                         if len(p.get_text(strip=True)) > 100]
-            if paragraphs:
-                return ' '.join(paragraphs)
-                
-            return soup.get_text(separator=' ', strip=True)
+            return self._extract_from_html(page_source)
         
         except Exception as e:
             if self.debug:
-                logger.info(f"Error with Selenium: {str(e)[:100]}")
+                logger.debug("Error with Selenium: %.100s", e)
             return ""
-        
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
     
     def close(self):
         """Clean up any resources."""
-        pass
+        with self._driver_lock:
+            self._quit_driver()
+        self._session.close()
+    
+    def __del__(self):
+        # Don't leave a headless Chrome running if close() was never called
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def search_politician_image(self, name, position=""):
         """
@@ -428,6 +1073,40 @@ class SearchService:
             logger.error(f"Error in image search: {str(e)}")
             return ""
 
+    def search_politician_images_batch(self, names):
+        """
+        Look up images for several politicians at once.
+        
+        Names are resolved against Wikipedia in batched action-API requests;
+        only names without a Wikipedia image fall back to search_politician_image,
+        which also normalizes the name.
+        
+        Parameters:
+        - names: List of politician names
+        
+        Returns:
+        - Dict mapping each name to an image URL, or an empty string if none was found
+        """
+        logger.info(f"Searching for images of {len(names)} politicians")
+        
+        wiki_names = {name: name.strip().replace(' ', '_') for name in names}
+        try:
+            summaries = self._wiki_bulk_fetch(list(dict.fromkeys(wiki_names.values())))
+        except Exception as e:
+            logger.info(f"Batched Wikipedia image lookup failed: {str(e)[:50]}...")
+            summaries = {}
+        
+        images = {}
+        for name, wiki_name in wiki_names.items():
+            data = summaries.get(wiki_name) or {}
+            image = ""
+            # Same check as normalization, so a namesake's page isn't used
+            if data and self._verify_politician_match(data.get('extract', ''), self._name_index(name), ""):
+                image = (data.get('originalimage') or data.get('thumbnail') or {}).get('source', '')
+            images[name] = image or self.search_politician_image(name)
+        
+        return images
+    
     def _get_wikipedia_image(self, name):
         """Get an image from Wikipedia using their API"""
         try:
@@ -435,17 +1114,9 @@ class SearchService:
             wiki_name = name.replace(' ', '_')
             
             # Try to get Wikipedia summary which often includes an image
-            wiki_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{wiki_name}"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; PoliticianResearchBot/1.0)'
-            }
+            data = self._get_wikipedia_summary(wiki_name)
             
-            response = requests.get(wiki_url, headers=headers, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
+            if data:
                 # Check if there's an image in the response
                 if 'thumbnail' in data and 'source' in data['thumbnail']:
                     # Try to get the higher resolution original image
@@ -459,22 +1130,159 @@ class SearchService:
             logger.info(f"Wikipedia image error: {str(e)[:50]}...")
             return ""
 
+    def _get_wikipedia_summary(self, wiki_name):
+        """
+        Get the Wikipedia REST summary for a page title.
+        Successful lookups are cached since summaries rarely change.
+        
+        Parameters:
+        - wiki_name: Page title with spaces replaced by underscores
+        
+        Returns:
+        - Parsed summary dict, or None if the page wasn't found
+        """
+        cache_key = self._wiki_cache_key(wiki_name)
+        data = cache.get(cache_key)
+        if data is not None:
+            self._cache_hits += 1
+            return data
+        
+        wiki_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{wiki_name}"
+        response = self._session.get(wiki_url, headers=WIKI_HEADERS, timeout=WIKI_TIMEOUT)
+        if response.status_code != 200:
+            return None
+        
+        data = response.json()
+        cache.set(cache_key, data, WIKI_CACHE_TTL)
+        return data
+
+    def _wiki_bulk_fetch(self, titles):
+        """
+        Look up several Wikipedia pages with a single MediaWiki API request.
+        
+        Results are stored in the same cache as _get_wikipedia_summary, under
+        both the requested and the canonical title, in the subset of the REST
+        summary format this service reads (title, extract, thumbnail,
+        originalimage), so later summary and image lookups don't hit the network.
+        
+        Parameters:
+        - titles: Page titles with spaces replaced by underscores
+        
+        Returns:
+        - Dict mapping each title that was found to its summary dict
+        """
+        results = {}
+        requested = {}
+        for wiki_name in titles:
+            data = cache.get(self._wiki_cache_key(wiki_name))
+            if data is not None:
+                self._cache_hits += 1
+                results[wiki_name] = data
+            else:
+                requested[unquote(wiki_name).replace('_', ' ')] = wiki_name
+        
+        # The API returns intro extracts for at most WIKI_BATCH_SIZE pages per request
+        pending = list(requested.items())
+        for i in range(0, len(pending), WIKI_BATCH_SIZE):
+            results.update(self._wiki_query_batch(dict(pending[i:i + WIKI_BATCH_SIZE])))
+        
+        return results
+    
+    def _wiki_query_batch(self, requested):
+        """
+        Fetch one batch of pages for _wiki_bulk_fetch.
+        
+        Parameters:
+        - requested: Dict mapping API titles (with spaces) to the requested wiki names
+        
+        Returns:
+        - Dict mapping each requested wiki name that was found to its summary dict
+        """
+        results = {}
+        params = {
+            'action': 'query',
+            'format': 'json',
+            'formatversion': 2,
+            'redirects': 1,
+            'prop': 'pageimages|extracts|info',
+            'inprop': 'url',
+            'exintro': 1,
+            'explaintext': 1,
+            'exlimit': WIKI_BATCH_SIZE,
+            'piprop': 'original|thumbnail',
+            'pithumbsize': 320,
+            'titles': '|'.join(requested)
+        }
+        response = self._session.get(WIKI_API_URL, params=params, headers=WIKI_HEADERS, timeout=WIKI_TIMEOUT)
+        if response.status_code != 200:
+            return results
+        
+        query = response.json().get('query', {})
+        pages = {page['title']: page for page in query.get('pages', [])
+                 if not page.get('missing') and not page.get('invalid')}
+        # Title normalization and redirects map a requested title to its page
+        aliases = {entry['from']: entry['to']
+                   for entry in query.get('normalized', []) + query.get('redirects', [])}
+        
+        for api_title, wiki_name in requested.items():
+            title = api_title
+            for _ in range(3):
+                if title in pages:
+                    break
+                title = aliases.get(title, title)
+            page = pages.get(title)
+            if not page:
+                continue
+            
+            data = {
+                'title': page['title'],
+                'extract': page.get('extract', ''),
+                'content_urls': {'desktop': {'page': page.get('fullurl', '')}}
+            }
+            if 'thumbnail' in page:
+                data['thumbnail'] = {'source': page['thumbnail']['source']}
+            if 'original' in page:
+                data['originalimage'] = {'source': page['original']['source']}
+            
+            results[wiki_name] = data
+            # A page without an extract was cut off by the API's limits; don't
+            # let an incomplete entry stand in for the REST summary
+            if 'extract' in page:
+                cache.set(self._wiki_cache_key(wiki_name), data, WIKI_CACHE_TTL)
+                cache.set(self._wiki_cache_key(page['title'].replace(' ', '_')), data, WIKI_CACHE_TTL)
+        
+        return results
+    
+    @staticmethod
+    def _wiki_cache_key(wiki_name):
+        """Cache key for a Wikipedia page summary."""
+        return f"wiki_summary:{hashlib.sha1(wiki_name.encode('utf-8')).hexdigest()}"
+
     def _is_valid_image_url(self, url):
         """Simple check if a URL appears to be an image"""
         if not url:
             return False
             
-        # Check if URL has an image file extension
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-        return any(url.lower().endswith(ext) for ext in image_extensions)
+        # Check if the URL's path has an image file extension; the query
+        # string is ignored, so resized images like photo.jpg?width=300 pass
+        try:
+            path = _cached_parse(url).path
+        except ValueError:
+            return False
+        dot = path.rfind('.')
+        return dot != -1 and path[dot + 1:].lower() in _IMAGE_EXTS
 
     def _extract_image_from_page(self, url, name):
         """Extract a likely politician image from a webpage"""
         try:
-            content = self._scrape_with_requests(url)
-            soup = BeautifulSoup(content, 'html.parser')
+            content, encoding = self._fetch_capped(url, MAX_PAGE_BYTES)
+            soup = self._make_soup(content.decode(encoding, errors='replace'), parse_only=_IMG_STRAINER)
+            
+            # Loop-invariant values, computed once per page
+            name_parts = name.lower().split()
+            parsed_url = _cached_parse(url)
             
-            # Look for images that might be the politician
+            # Look for images that might be the politician; stop at the first match
             for img in soup.find_all('img'):
                 src = img.get('src', '')
                 if not src:
@@ -482,26 +1290,25 @@ class SearchService:
                     
                 # Convert relative URL to absolute if needed
                 if src.startswith('/'):
-                    parsed_url = urlparse(url)
                     src = f"{parsed_url.scheme}://{parsed_url.netloc}{src}"
                     
-                # Skip tiny images (likely icons)
-                width = img.get('width')
-                height = img.get('height')
-                if width and height and (int(width) < 100 or int(height) < 100):
-                    continue
+                # Skip tiny images (likely icons); ignore non-numeric sizes like "100%"
+                try:
+                    if int(img['width']) < 100 or int(img['height']) < 100:
+                        continue
+                except (KeyError, TypeError, ValueError):
+                    pass
                     
                 # Look for images that might contain the politician's name or relevant terms
-                alt_text = img.get('alt', '').lower()
-                name_parts = name.lower().split()
+                alt_lower = img.get('alt', '').lower()
+                src_lower = src.lower()
                 
                 # Check if all parts of the name appear in the alt text or src
-                if all(part in alt_text or part in src.lower() for part in name_parts):
+                if all(part in alt_lower or part in src_lower for part in name_parts):
                     return src
                     
                 # Check for common politician image indicators
-                relevant_terms = ['portrait', 'headshot', 'photo', 'profile', 'politician']
-                if any(term in alt_text or term in src.lower() for term in relevant_terms):
+                if any(term in alt_lower or term in src_lower for term in _RELEVANT_IMG_TERMS):
                     return src
                     
             return ""
@@ -513,7 +1320,9 @@ class SearchService:
     def normalize_politician_name(self, name, position=""):
         """
         Attempts to find the standardized/official name of a politician using Wikipedia and LLM.
-        Gathers context about the politician first to improve accuracy.
+        A direct Wikipedia match is used as-is; otherwise context about the
+        politician is gathered to improve the LLM's accuracy.
+        Successful normalizations are cached in-process.
         
         Parameters:
         - name: The input name (could be nickname, misspelling, etc.)
@@ -522,13 +1331,54 @@ class SearchService:
         Returns:
         - Tuple of (normalized_name, wikipedia_url) or (original_name, None) if not found
         """
+        cache_key = (name, position)
+        with _normalized_names_lock:
+            cached = _normalized_names.get(cache_key)
+        if cached is not None:
+            self._cache_hits += 1
+            logger.debug("Using cached normalization for %s", name)
+            return cached
+        
+        normalized = self._normalize_politician_name(name, position)
+        
+        # Only remember lookups that found something; failures may be transient
+        if normalized != (name, None):
+            with _normalized_names_lock:
+                _normalized_names[cache_key] = normalized
+        return normalized
+    
+    def _normalize_politician_name(self, name, position=""):
+        """Uncached implementation of normalize_politician_name."""
         logger.info(f"Normalizing politician name: {name}")
         
         try:
-            # Step 1: Gather context about the politician
+            # Parse the name once for every article checked below
+            name_index = self._name_index(name)
+            
+            # Step 1: Try direct Wikipedia lookup with original name; when it
+            # matches, the context gathering and LLM round-trip are not needed
+            wiki_name = name.replace(' ', '_')
+            data = self._get_wikipedia_summary(wiki_name)
+            
+            # If direct lookup works, verify it's the right person
+            if data:
+                if 'title' in data and 'extract' in data:
+                    wiki_title = data['title']
+                    wiki_extract = data['extract']
+                    page_url = f"https://en.wikipedia.org/wiki/{wiki_name}"
+                    
+                    # Verify this is the right person by checking the content
+                    if self._verify_politician_match(wiki_extract, name_index, position):
+                        self._skip_llm_hits += 1
+                        logger.info(f"Found Wikipedia page: normalized '{name}' to '{wiki_title}'")
+                        return wiki_title, page_url
+                    else:
+                        logger.info(f"Found Wikipedia page for '{wiki_title}' but doesn't match our politician")
+            
+            # Step 2: Gather context about the politician
             context = self._gather_politician_context(name, position)
             
-            # Step 2: Try LLM-based normalization with context
+            # Step 3: Try LLM-based normalization with context
             if context:
                 normalized_name = self._normalize_name_with_llm(name, position, context)
                 if normalized_name and normalized_name != name:
@@ -539,69 +1389,45 @@ class SearchService:
                     wiki_url = f"https://en.wikipedia.org/wiki/{wiki_name}"
                     
                     # Verify this page exists
-                    verify_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{wiki_name}"
-                    headers = {'User-Agent': 'Mozilla/5.0 (compatible; PoliticianResearchBot/1.0)'}
-                    
                     try:
-                        response = requests.get(verify_url, headers=headers, timeout=5)
-                        if response.status_code == 200:
+                        if self._get_wikipedia_summary(wiki_name):
                             # We found a Wikipedia page for the LLM-normalized name
                             return normalized_name, wiki_url
                     except Exception:
                         pass  # Continue with other approaches
         
-            # Step 3: Try direct Wikipedia lookup with original name
-            wiki_name = name.replace(' ', '_')
-            wiki_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{wiki_name}"
-            
-            headers = {'User-Agent': 'Mozilla/5.0 (compatible; PoliticianResearchBot/1.0)'}
-            
-            response = requests.get(wiki_url, headers=headers, timeout=5)
-            
-            # If direct lookup works, verify it's the right person
-            if response.status_code == 200:
-                data = response.json()
-                if 'title' in data and 'extract' in data:
-                    wiki_title = data['title']
-                    wiki_extract = data['extract']
-                    page_url = f"https://en.wikipedia.org/wiki/{wiki_name}"
-                    
-                    # Verify this is the right person by checking the content
-                    if self._verify_politician_match(wiki_extract, name, position):
-                        logger.info(f"Found Wikipedia page: normalized '{name}' to '{wiki_title}'")
-                        return wiki_title, page_url
-                    else:
-                        logger.info(f"Found Wikipedia page for '{wiki_title}' but doesn't match our politician")
-        
             # Step 4: Try search with position
             search_query = f"{name} {position} politician wikipedia"
             search_results = self.search(search_query, num_results=5)
             
+            # Collect Wikipedia candidates in rank order
+            candidates = []
             for result in search_results:
                 url = result.get('url', '')
                 if 'wikipedia.org/wiki/' in url:
                     # Extract the title from the Wikipedia URL
-                    path_parts = urlparse(url).path.split('/')
+                    path_parts = _cached_parse(url).path.split('/')
                     if len(path_parts) > 2:
-                        wiki_name = path_parts[-1]
-                        wiki_title = wiki_name.replace('_', ' ')
-                        
-                        # Get content to verify
-                        verify_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{wiki_name}"
-                        try:
-                            verify_response = requests.get(verify_url, headers=headers, timeout=5)
-                            if verify_response.status_code == 200:
-                                verify_data = verify_response.json()
-                                if 'title' in verify_data and 'extract' in verify_data:
-                                    wiki_title = verify_data['title']
-                                    
-                                    # Verify this is the right person
-                                    if self._verify_politician_match(verify_data.get('extract', ''), name, position):
-                                        logger.info(f"Found Wikipedia page via search: normalized '{name}' to '{wiki_title}'")
-                                        return wiki_title, url
-                        except Exception as e:
-                            logger.info(f"Error verifying Wikipedia page: {str(e)[:50]}...")
-                            continue
+                        candidates.append((path_parts[-1], url))
+            
+            # Fetch all candidate summaries in one request, then verify in rank order
+            if candidates:
+                try:
+                    summaries = self._wiki_bulk_fetch([wiki_name for wiki_name, _ in candidates])
+                except Exception as e:
+                    logger.info(f"Error fetching Wikipedia candidates: {str(e)[:50]}...")
+                    summaries = {}
+                
+                for wiki_name, url in candidates:
+                    verify_data = summaries.get(wiki_name)
+                    if verify_data:
+                        if 'title' in verify_data and 'extract' in verify_data:
+                            wiki_title = verify_data['title']
+                            
+                            # Verify this is the right person
+                            if self._verify_politician_match(verify_data.get('extract', ''), name_index, position):
+                                logger.info(f"Found Wikipedia page via search: normalized '{name}' to '{wiki_title}'")
+                                return wiki_title, url
             
             # Step 5: If we have an LLM-normalized name but no Wikipedia page, return just the name
             if 'normalized_name' in locals() and normalized_name and normalized_name != name:
@@ -632,14 +1458,10 @@ class SearchService:
             
             # Try Wikipedia first (direct search)
             wiki_name = name.replace(' ', '_')
-            wiki_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{wiki_name}"
-            
-            headers = {'User-Agent': 'Mozilla/5.0 (compatible; PoliticianResearchBot/1.0)'}
             
             try:
-                response = requests.get(wiki_url, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
+                data = self._get_wikipedia_summary(wiki_name)
+                if data:
                     if 'extract' in data:
                         # We found Wikipedia context directly
                         context_pieces.append(f"Wikipedia information: {data['extract']}")
@@ -655,27 +1477,38 @@ class SearchService:
                     f"{name} politician profile"
                 ]
                 
-                for query in search_queries[:2]:  # Limit to first 2 queries for efficiency
-                    results = self.search(query, num_results=3)
-                    
-                    for result in results:
-                        # Prioritize Wikipedia and official sources
-                        url = result.get('url', '')
-                        if 'wikipedia.org' in url or '.gov.' in url or 'official' in url.lower():
-                            try:
-                                # Get a small snippet of content
-                                content = self._scrape_with_requests(url)
-                                if content:
-                                    # Limit content length for LLM processing
-                                    snippet = content[:1000] if len(content) > 1000 else content
-                                    source_name = "Wikipedia" if "wikipedia.org" in url else "Official source" if ".gov" in url else "Source"
-                                    context_pieces.append(f"{source_name}: {snippet}")
-                                    break  # Just get one good source per query
-                            except Exception:
-                                continue
-                    
-                    if len(context_pieces) >= 2:  # If we have enough context, stop searching
-                        break
+                # Limit to first 2 queries for efficiency, and run them concurrently
+                queries = search_queries[:2]
+                with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                    results_per_query = list(executor.map(lambda query: self.search(query, num_results=3), queries))
+                
+                # Prioritize Wikipedia and official sources
+                candidates_per_query = [
+                    [
+                        result.get('url', '') for result in results
+                        if 'wikipedia.org' in result.get('url', '') or '.gov.' in result.get('url', '') or 'official' in result.get('url', '').lower()
+                    ]
+                    for results in results_per_query
+                ]
+                
+                # Scrape every candidate at once instead of one at a time.
+                # fetch_content unpacks the scraper's (text, needs_js) result
+                # and falls back to the JS-capable scrapers when needed
+                candidate_urls = list(dict.fromkeys(url for urls in candidates_per_query for url in urls))
+                contents = {}
+                if candidate_urls:
+                    with ThreadPoolExecutor(max_workers=min(6, len(candidate_urls))) as executor:
+                        contents = dict(zip(candidate_urls, executor.map(self.fetch_content, candidate_urls)))
+                
+                for urls in candidates_per_query:
+                    for url in urls:
+                        content = contents.get(url)
+                        if content:
+                            # Limit content length for LLM processing
+                            snippet = content[:1000] if len(content) > 1000 else content
+                            source_name = "Wikipedia" if "wikipedia.org" in url else "Official source" if ".gov" in url else "Source"
+                            context_pieces.append(f"{source_name}: {snippet}")
+                            break  # Just get one good source per query
             
             # Return the combined context
             return "\n\n".join(context_pieces)
@@ -738,51 +1571,64 @@ class SearchService:
             logger.error(f"LLM normalization error: {str(e)}")
             return name
             
-    def _verify_politician_match(self, text, name, position):
+    @staticmethod
+    def _name_index(name):
+        """
+        Precompute the name forms used by _verify_politician_match, so a
+        caller checking several articles only parses the name once.
+        
+        Returns:
+        - Dict with the lowercased name, its parts, surname and "F. surname" form
+        """
+        name_lower = name.lower()
+        name_parts = name_lower.split()
+        return {
+            'lower': name_lower,
+            'parts': name_parts,
+            'surname': name_parts[-1] if name_parts else "",
+            'initial_surname': f"{name_parts[0][0]}. {name_parts[-1]}" if len(name_parts) > 1 else None
+        }
+    
+    def _verify_politician_match(self, text, name_index, position):
         """
         Verify if a Wikipedia article is about the politician we're looking for.
         
         Parameters:
         - text: Article extract/content
-        - name: Original politician name
+        - name_index: Original politician name, as returned by _name_index
         - position: Politician position
         
         Returns:
         - Boolean indicating if it's likely the same person
         """
         text_lower = text.lower()
-        name_lower = name.lower()
+        
+        # For Filipino politicians with nicknames, the last name is usually reliable
+        surname = name_index['surname']
         
         # If position is mentioned and specific enough, it's a strong indicator
         if position and len(position) > 3 and position.lower() in text_lower:
-            # Split the name and check if at least the last name is present
-            name_parts = name_lower.split()
-            if len(name_parts) > 0 and name_parts[-1] in text_lower:
+            # Check if at least the last name is present
+            if surname and surname in text_lower:
                 return True
                 
         # Check for exact name matches
-        if name_lower in text_lower:
+        if name_index['lower'] in text_lower:
             return True
             
-        # Check for variations of the name
-        name_parts = name_lower.split()
-        
-        # For Filipino politicians with nicknames, the last name is usually reliable
-        surname = name_parts[-1] if len(name_parts) > 0 else ""
-        
         # If the surname appears and it's not extremely common
         if surname and surname in text_lower:
-            common_surnames = ['garcia', 'santos', 'reyes', 'cruz', 'dela cruz', 'gonzales', 'bautista', 'lopez']
-            if surname not in common_surnames:
+            if surname not in _COMMON_SURNAMES:
                 return True
-            elif len(text_lower.split()) > 100:  # If article is substantial with common surname
+            
+            # Only tokenize the text when the cheap checks above were inconclusive
+            tokens = _WORD_RE.findall(text_lower)
+            if len(tokens) > 100:  # If article is substantial with common surname
                 # Check if first name initial + last name appears
-                if len(name_parts) > 1 and f"{name_parts[0][0]}. {surname}" in text_lower:
+                if name_index['initial_surname'] and name_index['initial_surname'] in text_lower:
                     return True
                 # Check if text mentions politician role
-                political_terms = ['politician', 'mayor', 'governor', 'senator', 'congressman', 
-                                'representative', 'official', 'elected', 'public servant']
-                if any(term in text_lower for term in political_terms):
+                if any(token.startswith(_POLITICAL_TERMS) for token in tokens) or any(phrase in text_lower for phrase in _POLITICAL_PHRASES):
                     return True
                 return False  # Common surname without additional evidence
             return False
@@ -0,0 +1,29 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .cache import invalidate_politician_cache, research_result_cache_key
+from .models import Politician, ResearchResult
+
+@receiver([post_save, post_delete], sender=Politician)
+def politician_changed(sender, instance, **kwargs):
+    """Invalidate cached politician responses when a politician changes."""
+    # Read the id now; delete() clears it before on_commit callbacks run
+    politician_id = instance.id
+    transaction.on_commit(lambda: invalidate_politician_cache(politician_id))
+
+@receiver([post_save, post_delete], sender=ResearchResult)
+def research_result_changed(sender, instance, **kwargs):
+    """
+    Drop the cached serialized research, and the politician responses
+    that embed it, once the research and its sources have been committed.
+    """
+    research_id, politician_id = instance.pk, instance.politician_id
+    
+    def invalidate():
+        cache.delete_many([
+            research_result_cache_key(research_id),
+            research_result_cache_key(research_id, include_sources=False)
+        ])
+        invalidate_politician_cache(politician_id)
+    transaction.on_commit(invalidate)
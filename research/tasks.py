@@ -0,0 +1,59 @@
+from celery import shared_task
+from django.core.cache import cache
+from django.utils import timezone
+from chat.models import Chat
+from .cache import research_lock_key
+from .models import ResearchResult
+from .services.pipeline_service import get_pipeline
+from operator import itemgetter
+import logging
+
+logger = logging.getLogger("Research Tasks")
+
+@shared_task(bind=True)
+def research_politician_task(self, name, position, max_age=7):
+    """
+    Run the research pipeline for a politician in a Celery worker.
+    
+    Parameters:
+    - name: Politician name (will be normalized by the pipeline)
+    - position: Required position for this research
+    - max_age: Saved research younger than this many days is returned as is;
+      0 always runs the pipeline
+    
+    Returns:
+    - Dictionary with the research_id of the saved ResearchResult, or
+      an error dictionary with the urls/titles of any gathered content
+    """
+    logger.info(f"Task {self.request.id}: researching {name} ({position})")
+    
+    try:
+        result = get_pipeline().research_politician(name, position, max_age=max_age)
+    finally:
+        # Let the next request for this politician queue a new task
+        lock_key = research_lock_key(name, position)
+        if cache.get(lock_key) == self.request.id:
+            cache.delete(lock_key)
+    
+    # Chats created while this task was queued are waiting on its report
+    Chat.objects.filter(research_task_id=self.request.id).update(
+        research_report_id=result.id if isinstance(result, ResearchResult) else None,
+        research_task_id='',
+        updated_at=timezone.now(),
+    )
+    
+    if isinstance(result, ResearchResult):
+        return {'research_id': result.id}
+    
+    # Task results must be JSON serializable, so drop model instances
+    # and keep only the fields the views expose
+    response_data = {
+        'error': result.get('error', 'An unknown error occurred') if isinstance(result, dict) else 'Research returned no result',
+    }
+    if isinstance(result, dict) and 'content_list' in result:
+        # Pipeline content items always carry url and title
+        response_data['content_list'] = [
+            {'url': url, 'title': title}
+            for url, title in map(itemgetter('url', 'title'), result['content_list'])
+        ]
+    return response_data
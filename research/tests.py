@@ -1,3 +1,173 @@
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Politician, ResearchResult, ResearchSource
+from .serializers import ResearchResultSerializer
+from .services.politician_service import PoliticianPipeline
+from .services.search_service import SearchService
+from .tasks import research_politician_task
+
+
+class CachedFieldsMixinTests(TestCase):
+    def test_nested_serializers_are_bound_per_instance(self):
+        first = ResearchResultSerializer(context={'request': 'first'})
+        second = ResearchResultSerializer(context={'request': 'second'})
+
+        first_child = first.fields['sources'].child
+        second_child = second.fields['sources'].child
+
+        self.assertIsNot(first_child, second_child)
+        self.assertIs(first_child.root, first)
+        self.assertEqual(first_child.context, {'request': 'first'})
+        self.assertEqual(second_child.context, {'request': 'second'})
+
+
+class GetPoliticiansQueryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for i in range(5):
+            politician = Politician.objects.create(name=f"Politician {i}")
+            for position in ('Mayor', 'Senator'):
+                result = ResearchResult.objects.create(politician=politician, position=position)
+                ResearchSource.objects.create(result=result, url=f"https://example.com/{i}/{position}")
+
+    def test_page_query_count_does_not_grow_with_rows(self):
+        # COUNT, the page of politicians, their latest research and its sources
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/politicians/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 5)
+
+    def test_cached_page_runs_no_queries(self):
+        self.client.get('/api/politicians/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/politicians/')
+
+        self.assertEqual(response.status_code, 200)
+
+
+@mock.patch.object(research_politician_task, 'apply_async')
+class ResearchTaskFlowTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def queue_research(self):
+        response = self.client.get('/api/research/Jane Doe/', {'position': 'Senator'})
+        self.assertEqual(response.status_code, 202)
+        return response.json()['task_id']
+
+    def get_status(self, task_id, state, result=None):
+        with mock.patch('research.views.AsyncResult') as async_result:
+            async_result.return_value.state = state
+            async_result.return_value.result = result
+            return self.client.get(f'/api/research/status/{task_id}/')
+
+    def test_missing_research_is_queued(self, apply_async):
+        response = self.client.get('/api/research/Jane Doe/', {'position': 'Senator'})
+
+        self.assertEqual(response.status_code, 202)
+        body = response.json()
+        self.assertEqual(body['status'], 'pending')
+        apply_async.assert_called_once_with(args=('jane doe', 'Senator', 7), task_id=body['task_id'])
+
+    def test_concurrent_requests_share_one_task(self, apply_async):
+        first = self.queue_research()
+        second = self.queue_research()
+
+        self.assertEqual(first, second)
+        apply_async.assert_called_once()
+
+    def test_status_of_unknown_task_is_404(self, apply_async):
+        response = self.get_status('not-a-task', 'PENDING')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_status_while_pending_is_202(self, apply_async):
+        response = self.get_status(self.queue_research(), 'PENDING')
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['status'], 'pending')
+
+    def test_status_when_done_returns_research(self, apply_async):
+        task_id = self.queue_research()
+        politician = Politician.objects.create(name="Jane Doe")
+        research = ResearchResult.objects.create(politician=politician, position="Senator", summary="Summary")
+
+        response = self.get_status(task_id, 'SUCCESS', {'research_id': research.id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], research.id)
+        self.assertTrue(response.json()['metadata']['is_fresh'])
+
+    def test_status_without_result_is_400(self, apply_async):
+        result = {'error': 'No content found', 'content_list': [{'url': 'https://example.com', 'title': 'Example'}]}
+
+        response = self.get_status(self.queue_research(), 'SUCCESS', result)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'No content found')
+        self.assertEqual(response.json()['content_list'], result['content_list'])
+
+    def test_status_of_failed_task_is_500(self, apply_async):
+        response = self.get_status(self.queue_research(), 'FAILURE', RuntimeError('boom'))
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()['status'], 'failure')
+
+
+class ResearchPoliticianMethodTests(TestCase):
+    def test_options_is_allowed(self):
+        response = self.client.options('/api/research/Jane Doe/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('GET', response['Allow'])
+        self.assertIn('POST', response['Allow'])
+
+    def test_unsupported_methods_are_405(self):
+        self.assertEqual(self.client.put('/api/research/Jane Doe/').status_code, 405)
+        self.assertEqual(self.client.delete('/api/research/Jane Doe/').status_code, 405)
+
+
+class PoliticianImageBatchTests(TestCase):
+    def test_batch_uses_verified_wikipedia_images_and_falls_back_per_name(self):
+        service = SearchService()
+        summaries = {
+            'Jane_Doe': {
+                'extract': 'Jane Doe is a Filipino politician serving as senator.',
+                'originalimage': {'source': 'https://upload.wikimedia.org/jane.jpg'},
+            },
+            'John_Roe': {
+                'extract': 'A river in the northern provinces.',
+                'originalimage': {'source': 'https://upload.wikimedia.org/river.jpg'},
+            },
+        }
+        with mock.patch.object(service, '_wiki_bulk_fetch', return_value=summaries) as bulk_fetch, \
+             mock.patch.object(service, 'search_politician_image', return_value='') as single_lookup:
+            images = service.search_politician_images_batch(['Jane Doe', 'John Roe'])
+
+        bulk_fetch.assert_called_once_with(['Jane_Doe', 'John_Roe'])
+        single_lookup.assert_called_once_with('John Roe')
+        self.assertEqual(images, {'Jane Doe': 'https://upload.wikimedia.org/jane.jpg', 'John Roe': ''})
+
+    def test_enrich_images_saves_found_images(self):
+        with_image = Politician.objects.create(name="Has Image", image_url="https://example.com/has.jpg")
+        jane = Politician.objects.create(name="Jane Doe")
+        john = Politician.objects.create(name="John Roe")
+        search_service = mock.Mock()
+        search_service.search_politician_images_batch.return_value = {
+            'Jane Doe': 'https://example.com/jane.jpg', 'John Roe': ''
+        }
+        pipeline = PoliticianPipeline(search_service=search_service, llm_service=mock.Mock())
+
+        updated = pipeline.enrich_images([with_image, jane, john])
+
+        self.assertEqual(updated, 1)
+        search_service.search_politician_images_batch.assert_called_once_with(['Jane Doe', 'John Roe'])
+        jane.refresh_from_db()
+        john.refresh_from_db()
+        self.assertEqual(jane.image_url, 'https://example.com/jane.jpg')
+        self.assertIsNone(john.image_url)
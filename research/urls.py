@@ -4,6 +4,7 @@ from . import views
 urlpatterns = [
     path('research/<str:name>/', views.research_politician, name='research_politician'),
     path('research/report/<int:report_id>/', views.get_research_report, name='get_research_report'),
+    path('research/status/<str:task_id>/', views.research_status, name='research_status'),
 
     # endpoint for politicians
     path('politicians/', views.get_politicians, name='get_politicians'),
@@ -1,27 +1,149 @@
-from django.http import JsonResponse
-from django.views.decorators.http import require_http_methods
-from django.views.decorators.csrf import csrf_exempt
+from django.http import HttpResponseNotModified
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from .models import Politician, ResearchResult
-from .services.pipeline_service import ResearchPipeline
-from .serializers import PoliticianSerializer, ResearchResultSerializer
+from .tasks import research_politician_task
+from .serializers import PoliticianSerializer, ResearchResultSerializer, ResearchResultLiteSerializer
+from .cache import (
+    politicians_cache_key, politicians_count_key, politician_cache_key,
+    research_lock_key, research_result_cache_key, research_task_key, POLITICIANS_CACHE_TTL,
+    POLITICIAN_CACHE_TTL, RESEARCH_LOCK_TTL, RESEARCH_RESULT_CACHE_TTL, RESEARCH_TASK_TTL
+)
+from django.core.cache import cache
+from django.db.models import Prefetch
 from django.utils import timezone
+from django.utils.http import parse_etags
+from celery.result import AsyncResult
 from datetime import timedelta
-import json
+from itertools import islice
 import logging
+import re
+import uuid
 
 # Set up logger
 logger = logging.getLogger("Research View")
 
-@csrf_exempt
-@require_http_methods(["GET", "POST"])
+# Control characters (other than tab/newline/CR) and U+FFFD replacement
+# characters mark content that was binary or decoded with the wrong charset
+_BINARY_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffd]')
+
+# Number of leading characters of a source scanned for binary content
+BINARY_CHECK_CHARS = 2048
+
+# Maximum number of sources returned with a research report
+MAX_REPORT_SOURCES = 50
+
+def _is_clean_source(source):
+    """
+    Check that a serialized source doesn't hold binary or corrupt content.
+    Only the start of the content is scanned; decoding garbage shows up early.
+    """
+    content = source.get('content')
+    # Keep sources without content or with null content
+    if not content or not isinstance(content, str):
+        return True
+    return not _BINARY_RE.search(content, 0, BINARY_CHECK_CHARS)
+
+def _queue_research(name, position, max_age):
+    """
+    Enqueue a research task and return 202 with the task id to poll.
+    """
+    return _pending_response(_start_research(name, position, max_age), name, position)
+
+def _start_research(name, position, max_age):
+    """
+    Enqueue a research task and return its id.
+    
+    The task reuses saved research younger than max_age days, so pass 0
+    to always research again.
+    
+    Concurrent requests for the same politician and position share the
+    task that is already in flight instead of queueing a duplicate.
+    """
+    lock_key = research_lock_key(name, position)
+    task_id = str(uuid.uuid4())
+    
+    # Only the caller whose add() wins queues a task; if the lock is released
+    # between a failed add() and the get(), try to take it again
+    while not cache.add(lock_key, task_id, RESEARCH_LOCK_TTL):
+        in_flight_id = cache.get(lock_key)
+        if in_flight_id:
+            logger.info("Research for %s (%s) already in flight as task %s", name, position, in_flight_id)
+            return in_flight_id
+    
+    # Record the id first so research_status knows it as soon as it is returned
+    cache.set(research_task_key(task_id), True, RESEARCH_TASK_TTL)
+    try:
+        research_politician_task.apply_async(args=(name, position, max_age), task_id=task_id)
+    except Exception:
+        cache.delete_many([lock_key, research_task_key(task_id)])
+        raise
+    logger.info("Queued research task %s for %s (%s)", task_id, name, position)
+    
+    return task_id
+
+def _pending_response(task_id, name, position):
+    """
+    Response telling the client which research task to poll.
+    """
+    return Response({
+        'success': True,
+        'task_id': task_id,
+        'status': 'pending',
+        'name': name,
+        'position': position
+    }, status=202)
+
+def _serialize_research_result(research_result, include_sources):
+    """
+    Serialize a ResearchResult, reusing the cached serialization when the
+    result was serialized before. Callers get their own copy of the dict.
+    Sources are only queried and serialized when include_sources is set.
+    """
+    cache_key = research_result_cache_key(research_result.pk, include_sources)
+    response_data = cache.get(cache_key)
+    if response_data is None:
+        serializer_class = ResearchResultSerializer if include_sources else ResearchResultLiteSerializer
+        response_data = dict(serializer_class(research_result).data)
+        cache.set(cache_key, response_data, RESEARCH_RESULT_CACHE_TTL)
+    return response_data
+
+def _research_etag(research_result, age, include_sources):
+    """
+    Weak ETag for a fresh research_politician response. Changes when the
+    research is replaced or edited, when its age in days ticks over, and
+    with include_sources, since each of those changes the response body.
+    """
+    return f'W/"{research_result.pk}-{int(research_result.updated_at.timestamp())}-{age.days}-{int(include_sources)}"'
+
+def _research_result_response(research_result, max_age, include_sources, request_method, age=None):
+    """
+    Serialize a ResearchResult the way research_politician returns it.
+    
+    Parameters:
+    - age: Age of the research if the caller already computed it
+    """
+    if age is None:
+        age = timezone.now() - research_result.created_at
+    
+    response_data = _serialize_research_result(research_result, include_sources)
+    
+    # Add metadata
+    response_data['metadata'] = {
+        'is_fresh': age.days < max_age,
+        'age_days': age.days,
+        'request_method': request_method
+    }
+    
+    return Response(response_data)
+
 @api_view(['GET', 'POST'])
 def research_politician(request, name):
     """
     API endpoint to research a politician by name.
     
-    GET: Retrieve existing research if available
+    GET: Retrieve existing research if available; research older than
+         max_age is still returned while a refresh runs in the background
     POST: Force a new research to be conducted
     
     Additional query parameters:
@@ -30,7 +152,7 @@ def research_politician(request, name):
     - include_sources: Whether to include sources in response (default: False)
     - detailed: Whether to return detailed results (default: False)
     """
-    logger.info(f"Research request for politician: {name}")
+    logger.info("Research request for politician: %s", name)
     
     # Get parameters from query string
     position = request.GET.get('position', '')
@@ -48,105 +170,68 @@ def research_politician(request, name):
     
     # Normalize name for search
     normalized_name = name.strip().lower()
-    logger.info(f"Parameters: position={position}, max_age={max_age}, include_sources={include_sources}, detailed={detailed}")
+    logger.info("Parameters: position=%s, max_age=%s, include_sources=%s, detailed=%s", position, max_age, include_sources, detailed)
 
     try:
-        # Try to find the politician in the database
-        try:
-            # Find politician by name only
-            politician = Politician.objects.get(name__iexact=normalized_name)
-            logger.info(f"Found politician in database: {politician.name}")
-            
-            # Check if we have recent research for this politician and position
-            latest_research = None
+        # Find the latest research for this politician and position in a
+        # single query, joining the politician row it belongs to (only its
+        # name is used, so its long text columns are left behind)
+        latest_research = ResearchResult.objects.select_related('politician').defer(
+            'politician__bio', 'politician__issues'
+        ).filter(
+            politician__name__lower=normalized_name,
+            position__lower=position.lower()
+        ).order_by('-created_at').first()
+        
+        force_refresh = request.method == 'POST'
+        age = timezone.now() - latest_research.created_at if latest_research else None
+        
+        if age is not None and age < timedelta(days=max_age) and not force_refresh:
+            # Use existing research, or tell the client its copy is current
+            etag = _research_etag(latest_research, age, include_sources)
+            if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+                logger.info("Research for %s not modified", latest_research.politician.name)
+                response = HttpResponseNotModified()
+            else:
+                logger.info("Using existing research for %s (age: %s days)", latest_research.politician.name, age.days)
+                response = _research_result_response(latest_research, max_age, include_sources, request.method, age=age)
+            response['ETag'] = etag
+            return response
+        
+        if latest_research and not force_refresh:
+            # Serve the stale research right away and refresh it in a worker
+            logger.info("Serving stale research for %s (age: %s days), refreshing in background", latest_research.politician.name, age.days)
             try:
-                if position:
-                    # Filter by both politician and position
-                    latest_research = ResearchResult.objects.filter(
-                        politician=politician,
-                        position__iexact=position
-                    ).order_by('-created_at').first()
-                else:
-                    # Get the latest research for this politician regardless of position
-                    latest_research = ResearchResult.objects.filter(
-                        politician=politician
-                    ).order_by('-created_at').first()
+                task_id = _start_research(latest_research.politician.name, position, max_age)
             except Exception as e:
-                logger.error(f"Error retrieving latest research: {str(e)}")
-            
-            force_refresh = request.method == 'POST'
-            current_time = timezone.now()
-            
-            if (latest_research and 
-                current_time - latest_research.created_at < timedelta(days=max_age) and 
-                not force_refresh):
-                # Use existing research
-                logger.info(f"Using existing research (age: {(current_time - latest_research.created_at).days} days)")
-                research_result = latest_research
-            else:
-                # Conduct new research
-                logger.info(f"Conducting new research for {politician.name}, position: {position}")
-                pipeline = ResearchPipeline()
-                research_result = pipeline.research_politician(politician.name, position)
-                
-        except Politician.DoesNotExist:
-            # Politician not found, conduct new research
-            logger.info(f"Politician not found in database, conducting new research")
-            pipeline = ResearchPipeline()
-            research_result = pipeline.research_politician(normalized_name, position)
-        
-        # Handle different result types
-        if isinstance(research_result, ResearchResult):
-            # Result is a ResearchResult model instance
-            logger.info(f"Processing ResearchResult model instance")
-            serializer = ResearchResultSerializer(research_result)
-            response_data = serializer.data
-            
-            # Process response according to parameters
-            if not include_sources and 'sources' in response_data:
-                del response_data['sources']
-                            
-            # Add metadata
-            response_data['metadata'] = {
-                'is_fresh': (timezone.now() - research_result.created_at).days < max_age,
-                'age_days': (timezone.now() - research_result.created_at).days,
-                'request_method': request.method
-            }
-            
-            return Response(response_data)
-            
-        elif isinstance(research_result, dict):
-            # Result is a dictionary (error case or partial results)
-            logger.info(f"Processing dictionary result")
-            if 'error' in research_result:
-                # Error case
-                response_data = {
-                    'success': False,
-                    'error': research_result.get('error', 'An unknown error occurred'),
-                }
-                if 'content_list' in research_result:
-                    response_data['content_list'] = [
-                        {'url': item.get('url', ''), 'title': item.get('title', '')} 
-                        for item in research_result.get('content_list', [])
-                    ]
-                return Response(response_data, status=400)
-            else:
-                # Regular dictionary result
-                return Response(research_result)
+                # The stale research is still worth serving when no refresh can be queued
+                logger.error("Could not queue refresh for %s: %s", latest_research.politician.name, e)
+                task_id = None
+            response = _research_result_response(latest_research, max_age, include_sources, request.method, age=age)
+            if task_id:
+                response.data['metadata']['refresh_task_id'] = task_id
+            return response
+        
+        # Research under the stored name when we already know the politician
+        if latest_research:
+            politician = latest_research.politician
         else:
-            # Result is likely a content list
-            logger.info(f"Processing content list or unknown result type")
-            return Response({
-                'success': True,
-                'message': 'Research in progress, partial results returned',
-                'content_list': research_result if isinstance(research_result, list) else [],
-                'name': normalized_name,
-                'position': position
-            })
+            politician = Politician.objects.filter(name__lower=normalized_name).only('name').first()
+        
+        # POST must not be answered with the research it asked to replace
+        task_max_age = 0 if force_refresh else max_age
+        
+        if politician:
+            logger.info("Queueing new research for %s, position: %s", politician.name, position)
+            return _queue_research(politician.name, position, task_max_age)
+        
+        # Politician not found, conduct new research in a worker
+        logger.info("Politician not found in database, queueing new research")
+        return _queue_research(normalized_name, position, task_max_age)
             
     except Exception as e:
         # Handle any unexpected errors
-        logger.error(f"Unexpected error in research_politician view: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in research_politician view: %s", e, exc_info=True)
         return Response({
             'success': False,
             'error': f"An unexpected error occurred: {str(e)}",
@@ -154,8 +239,80 @@ def research_politician(request, name):
             'position': position
         }, status=500)
 
-@csrf_exempt
-@require_http_methods(["GET"])
+@api_view(['GET'])
+def research_status(request, task_id):
+    """
+    API endpoint to poll a research task queued by research_politician.
+    
+    Returns 202 while the task is pending or running, the serialized
+    research once it has finished, and 404 for task ids it never issued.
+    
+    Query parameters:
+    - max_age: Maximum age of cached results in days (default: 7)
+    - include_sources: Whether to include sources in response (default: False)
+    """
+    logger.info("Status request for research task: %s", task_id)
+    
+    max_age = int(request.GET.get('max_age', 7))
+    include_sources = request.GET.get('include_sources', '').lower() == 'true'
+    
+    try:
+        # Celery reports unknown ids as PENDING, so check the id was issued
+        if not cache.get(research_task_key(task_id)):
+            return Response({
+                'success': False,
+                'task_id': task_id,
+                'error': 'Research task not found',
+            }, status=404)
+        
+        task = AsyncResult(task_id)
+        state = task.state
+        
+        if state == 'FAILURE':
+            logger.error("Research task %s failed: %s", task_id, task.result)
+            return Response({
+                'success': False,
+                'task_id': task_id,
+                'status': 'failure',
+                'error': str(task.result)
+            }, status=500)
+        
+        if state != 'SUCCESS':
+            return Response({
+                'success': True,
+                'task_id': task_id,
+                'status': state.lower()
+            }, status=202)
+        
+        result = task.result or {}
+        if 'research_id' in result:
+            research_result = ResearchResult.objects.get(id=result['research_id'])
+            return _research_result_response(research_result, max_age, include_sources, request.method)
+        
+        # Pipeline finished without a result (error case or partial results)
+        response_data = {
+            'success': False,
+            'task_id': task_id,
+            'status': 'success',
+            'error': result.get('error', 'An unknown error occurred'),
+        }
+        if 'content_list' in result:
+            response_data['content_list'] = result['content_list']
+        return Response(response_data, status=400)
+        
+    except ResearchResult.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Research report not found',
+        }, status=404)
+        
+    except Exception as e:
+        logger.error("Unexpected error retrieving research task status: %s", e, exc_info=True)
+        return Response({
+            'success': False,
+            'error': f"An unexpected error occurred: {str(e)}",
+        }, status=500)
+
 @api_view(['GET'])
 def get_research_report(request, report_id):
     """
@@ -170,34 +327,24 @@ def get_research_report(request, report_id):
     include_sources = request.query_params.get('include_sources', '').lower() == 'true'
     
     try:
-        # Try to find the research report in the database
+        # Try to find the research report in the database; its sources are
+        # only queried when the serialized report isn't cached yet
         research_report = ResearchResult.objects.get(id=report_id)
         
         # Serialize the report
-        serializer = ResearchResultSerializer(research_report)
-        response_data = serializer.data
+        response_data = _serialize_research_result(research_report, include_sources)
         
         # Explicitly add politician_id to the response
-        response_data['politician_id'] = research_report.politician.id if research_report.politician else None
+        response_data['politician_id'] = research_report.politician_id
         
         # Process response according to parameters
         if include_sources and 'sources' in response_data:
             # Filter out problematic sources with corrupt content
             if isinstance(response_data['sources'], list):
-                filtered_sources = []
-                for source in response_data['sources']:
-                    # Check if content appears to be binary or corrupt
-                    if source.get('content') and isinstance(source['content'], str):
-                        # Filter out sources with binary content or very short corrupt content
-                        if not (source['content'].startswith('����') or 
-                                any(c for c in source['content'] if ord(c) > 127 and ord(c) < 32)):
-                            filtered_sources.append(source)
-                    else:
-                        # Keep sources without content or with null content
-                        filtered_sources.append(source)
-                response_data['sources'] = filtered_sources
-        elif not include_sources and 'sources' in response_data:
-            del response_data['sources']
+                response_data['sources'] = list(islice(
+                    (source for source in response_data['sources'] if _is_clean_source(source)),
+                    MAX_REPORT_SOURCES
+                ))
                     
         # Add metadata
         response_data['metadata'] = {
@@ -220,8 +367,6 @@ def get_research_report(request, report_id):
             'error': f"An unexpected error occurred: {str(e)}",
         }, status=500)
 
-@csrf_exempt
-@require_http_methods(["GET"])
 @api_view(['GET'])
 def get_politicians(request):
     """
@@ -240,15 +385,33 @@ def get_politicians(request):
     offset = int(request.GET.get('offset', 0))
     
     try:
-        # Query the database
-        query = Politician.objects.all()
+        # Serve repeat list requests from the cache
+        cache_key = politicians_cache_key(name_filter, limit, offset)
+        payload = cache.get(cache_key)
+        if payload is not None:
+            return Response(payload)
+        
+        # Query the database; issues isn't serialized, so don't load it.
+        # Each politician's latest research and its sources are prefetched
+        # for the whole page instead of being queried per row
+        latest_research = Prefetch(
+            'research_results',
+            queryset=ResearchResult.objects.order_by('-created_at')[:1],
+            to_attr='latest_research_list'
+        )
+        query = Politician.objects.defer('issues').prefetch_related(
+            latest_research, 'latest_research_list__sources'
+        )
         
         # Apply name filter if provided
         if name_filter:
             query = query.filter(name__icontains=name_filter)
             
-        # Get total count before pagination
-        total_count = query.count()
+        # Get total count before pagination; every page for this filter
+        # shares one cached count instead of running COUNT(*) per page
+        total_count = cache.get_or_set(
+            politicians_count_key(name_filter), query.count, POLITICIANS_CACHE_TTL
+        )
         
         # Apply pagination
         query = query.order_by('name')[offset:offset+limit]
@@ -256,11 +419,14 @@ def get_politicians(request):
         # Serialize the results
         serializer = PoliticianSerializer(query, many=True)
         
-        return Response({
+        payload = {
             'success': True,
             'count': total_count,
             'results': serializer.data
-        })
+        }
+        cache.set(cache_key, payload, POLITICIANS_CACHE_TTL)
+        
+        return Response(payload)
         
     except Exception as e:
         logger.error(f"Error retrieving politicians: {str(e)}", exc_info=True)
@@ -269,8 +435,6 @@ def get_politicians(request):
             'error': f"An unexpected error occurred: {str(e)}"
         }, status=500)
 
-@csrf_exempt
-@require_http_methods(["GET"])
 @api_view(['GET'])
 def get_politician(request, politician_id):
     """
@@ -279,16 +443,25 @@ def get_politician(request, politician_id):
     logger.info(f"Request for politician with ID: {politician_id}")
     
     try:
+        # Serve repeat detail requests from the cache
+        cache_key = politician_cache_key(politician_id)
+        payload = cache.get(cache_key)
+        if payload is not None:
+            return Response(payload)
+        
         # Try to find the politician in the database
-        politician = Politician.objects.get(id=politician_id)
+        politician = Politician.objects.defer('issues').get(id=politician_id)
         
         # Serialize the politician
         serializer = PoliticianSerializer(politician)
         
-        return Response({
+        payload = {
             'success': True,
             'data': serializer.data
-        })
+        }
+        cache.set(cache_key, payload, POLITICIAN_CACHE_TTL)
+        
+        return Response(payload)
         
     except Politician.DoesNotExist:
         return Response({
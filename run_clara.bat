@@ -12,5 +12,8 @@ pip install -r requirements.txt
 REM Apply migrations
 python manage.py migrate
 
+REM Start the Celery worker in its own window (requires Redis on localhost:6379)
+start "Clara worker" celery -A clara worker --loglevel=info --pool=solo
+
 REM Run the development server
 python manage.py runserver